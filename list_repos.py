@@ -14,7 +14,7 @@ async def main():
     await github_client.initialize()
     
     try:
-        repos = await github_client.get_user_repositories('01abhi01')
+        repos = [repo async for repo in github_client.get_user_repositories('01abhi01')]
         print(f'Found {len(repos)} repositories for 01abhi01:')
         for i, repo in enumerate(repos[:10], 1):  # Show first 10
             print(f'  {i}. {repo["full_name"]} ({repo["language"] or "Unknown"}) - {(repo["description"] or "No description")[:50]}')
@@ -8,6 +8,8 @@ import os
 import asyncio
 import argparse
 from pathlib import Path
+from itertools import islice
+from typing import Dict, Iterator, Tuple
 
 # Add project root to Python path
 project_root = Path(__file__).parent
@@ -19,12 +21,62 @@ from mcp import Resource, Tool
 from mcp.types import TextContent, ImageContent, EmbeddedResource
 from mcp.server.stdio import stdio_server
 
+try:
+    # Optional: compiled validation of tool arguments
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 # Import our modules
 from src.utils.config import Config
 from src.utils.logger import setup_logging
 from src.core.github_client import GitHubClient
 from src.core.repository_manager import RepositoryManager
-from src.core.analyzer import CodeAnalyzer
+from src.core.analyzer import CodeAnalyzer, RepositoryAnalysis
+from src.utils.cache import TTLCache
+
+
+# Tools offered by the server, shared by every instance
+_TOOL_DEFINITIONS = (
+    Tool(
+        name="analyze_repository",
+        description="Analyze a GitHub repository for security, quality, and performance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repository": {
+                    "type": "string",
+                    "description": "Repository name in format 'owner/repo'"
+                },
+                "analysis_type": {
+                    "type": "string",
+                    "enum": ["security", "quality", "performance", "full"],
+                    "description": "Type of analysis to perform"
+                }
+            },
+            "required": ["repository", "analysis_type"]
+        }
+    ),
+    Tool(
+        name="discover_repositories",
+        description="Discover all repositories for a GitHub user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {
+                    "type": "string",
+                    "description": "GitHub username to discover repositories for"
+                }
+            },
+            "required": ["username"]
+        }
+    )
+)
+
+# Each tool's input schema compiled to a validator once, at import
+_TOOL_VALIDATORS = {
+    tool.name: fastjsonschema.compile(tool.inputSchema) for tool in _TOOL_DEFINITIONS
+} if fastjsonschema is not None else {}
 
 
 class GitHubCodeReviewMCPServer:
@@ -40,6 +92,26 @@ class GitHubCodeReviewMCPServer:
         self.repo_manager = None
         self.analyzer = None
         
+        self.tools = _TOOL_DEFINITIONS
+        self._validators = _TOOL_VALIDATORS
+        
+        # Analyses keyed by (repository, head commit); the per-repository
+        # lock makes concurrent calls wait for one run instead of starting their own
+        self._analysis_cache = TTLCache(
+            maxsize=self.config.ANALYSIS_CACHE_SIZE if self.config.ENABLE_CACHING else 0,
+            ttl=self.config.CACHE_DURATION
+        )
+        self._analysis_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Tool name -> handler taking the call's arguments dict
+        self._handlers = {
+            "analyze_repository": lambda args: self._analyze_repository(
+                args["repository"],
+                args["analysis_type"]
+            ),
+            "discover_repositories": lambda args: self._discover_repositories(args["username"]),
+        }
+        
         # Register handlers
         self._register_tools()
         self._register_resources()
@@ -50,58 +122,27 @@ class GitHubCodeReviewMCPServer:
         
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="analyze_repository",
-                    description="Analyze a GitHub repository for security, quality, and performance",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "repository": {
-                                "type": "string",
-                                "description": "Repository name in format 'owner/repo'"
-                            },
-                            "analysis_type": {
-                                "type": "string",
-                                "enum": ["security", "quality", "performance", "full"],
-                                "description": "Type of analysis to perform"
-                            }
-                        },
-                        "required": ["repository", "analysis_type"]
-                    }
-                ),
-                Tool(
-                    name="discover_repositories",
-                    description="Discover all repositories for a GitHub user",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "username": {
-                                "type": "string",
-                                "description": "GitHub username to discover repositories for"
-                            }
-                        },
-                        "required": ["username"]
-                    }
-                )
-            ]
+            return list(self.tools)
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             """Handle tool calls"""
             try:
+                validate = self._validators.get(name)
+                if validate is not None:
+                    try:
+                        validate(arguments)
+                    except fastjsonschema.JsonSchemaException as e:
+                        return [TextContent(type="text", text=f"Invalid arguments for {name}: {e.message}")]
+                
+                handler = self._handlers.get(name)
+                if handler is None:
+                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+                
                 if not self.github_client:
                     await self._initialize_clients()
                 
-                if name == "analyze_repository":
-                    return await self._analyze_repository(
-                        arguments["repository"], 
-                        arguments["analysis_type"]
-                    )
-                elif name == "discover_repositories":
-                    return await self._discover_repositories(arguments["username"])
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+                return await handler(arguments)
                     
             except Exception as e:
                 self.logger.error(f"Tool call failed: {e}")
@@ -151,32 +192,33 @@ class GitHubCodeReviewMCPServer:
         try:
             self.logger.info(f"🔍 MCP: Analyzing {repository} (type: {analysis_type})")
             
-            # Clone repository
-            local_path = await self.repo_manager.clone_repository(repository)
-            
-            # Analyze
-            results = await self.analyzer.analyze_repository(local_path, analysis_type)
+            analysis = await self._cached_analyze(repository)
+            scores = analysis.overall_scores
             
             # Format results
             analysis_text = f"""
 🔍 **Analysis Results for {repository}**
 
 **Overall Scores:**
-- Security: {results['scores']['security']}/100
-- Quality: {results['scores']['quality']}/100  
-- Performance: {results['scores']['performance']}/100
+- Security: {scores.get('security', 0):.1f}/100
+- Quality: {scores.get('quality', 0):.1f}/100  
+- Performance: {scores.get('performance', 0):.1f}/100
 
 **Summary:**
-- Total Files: {results['summary']['total_files']}
-- Analyzed Files: {results['summary']['analyzed_files']}
-- Languages: {', '.join(results['summary']['languages'])}
+- Total Files: {analysis.total_files}
+- Analyzed Files: {analysis.analyzed_files}
+- Languages: {', '.join(analysis.languages)}
 
 **Top Issues ({analysis_type}):**
 """
             
             # Add top issues
-            for i, issue in enumerate(results['issues'][:10], 1):
-                analysis_text += f"  {i}. [{issue['severity']}] {issue['file']}: {issue['description']}\n"
+            top_issues = islice(self._issues_of_type(analysis, analysis_type), 10)
+            for i, (file_path, issue) in enumerate(top_issues, 1):
+                analysis_text += (
+                    f"  {i}. [{issue.get('severity', 'unknown')}] {file_path}: "
+                    f"{issue.get('description', 'Unknown issue')}\n"
+                )
             
             return [TextContent(type="text", text=analysis_text)]
             
@@ -184,24 +226,50 @@ class GitHubCodeReviewMCPServer:
             self.logger.error(f"Repository analysis failed: {e}")
             return [TextContent(type="text", text=f"❌ Analysis failed: {str(e)}")]
     
+    @staticmethod
+    def _issues_of_type(analysis: RepositoryAnalysis, analysis_type: str) -> Iterator[Tuple[str, dict]]:
+        """Yield (file path, issue) pairs in the requested category, or all of them for 'full'"""
+        for file_result in analysis.file_results:
+            for issue in file_result.issues:
+                if analysis_type == "full" or issue.get('category') == analysis_type:
+                    yield file_result.file_path, issue
+    
+    async def _cached_analyze(self, repository: str) -> RepositoryAnalysis:
+        """Analyze a repository, reusing its local clone and any analysis of the same commit"""
+        lock = self._analysis_locks.setdefault(repository, asyncio.Lock())
+        async with lock:
+            local_path = await self.repo_manager.get_local_path(repository)
+            if not local_path:
+                local_path = await self.repo_manager.clone_repository(repository)
+            
+            key = (repository, await self.repo_manager.get_head_sha(repository, local_path))
+            analysis = self._analysis_cache.get(key)
+            if analysis is None:
+                # Analysis is CPU-bound; run it in a thread so other requests keep being served
+                analysis = await asyncio.to_thread(self.analyzer.analyze_repository, local_path, repository)
+                self._analysis_cache.set(key, analysis)
+        
+        return analysis
+    
     async def _discover_repositories(self, username: str) -> list[TextContent]:
         """Discover repositories for a user"""
         try:
             self.logger.info(f"📦 MCP: Discovering repositories for {username}")
             
-            repos = await self.github_client.get_user_repositories(username)
-            
-            repo_text = f"📦 **Found {len(repos)} repositories for {username}:**\n\n"
+            repos = [repo async for repo in self.github_client.get_user_repositories(username)]
             
-            for repo in repos[:10]:  # Show first 10
-                repo_text += f"• **{repo['full_name']}** ({repo['language'] or 'Unknown'})\n"
-                repo_text += f"  {repo['description'] or 'No description'}\n"
-                repo_text += f"  ⭐ {repo['stargazers_count']} stars\n\n"
+            parts = [f"📦 **Found {len(repos)} repositories for {username}:**\n\n"]
+            parts.extend(
+                f"• **{repo['full_name']}** ({repo['language'] or 'Unknown'})\n"
+                f"  {repo['description'] or 'No description'}\n"
+                f"  ⭐ {repo['stargazers_count']} stars\n\n"
+                for repo in repos[:10]  # Show first 10
+            )
             
             if len(repos) > 10:
-                repo_text += f"... and {len(repos) - 10} more repositories\n"
+                parts.append(f"... and {len(repos) - 10} more repositories\n")
             
-            return [TextContent(type="text", text=repo_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             self.logger.error(f"Repository discovery failed: {e}")
@@ -211,12 +279,16 @@ class GitHubCodeReviewMCPServer:
         """Run the MCP server"""
         self.logger.info("🚀 Starting GitHub Code Review MCP Server...")
         
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            if self.analyzer:
+                self.analyzer.cleanup()
 
 
 async def main():
@@ -6,17 +6,36 @@ and quality metrics for multiple programming languages.
 """
 
 import ast
+import copy
+import mmap
+import multiprocessing
 import os
+import shutil
+import sqlite3
 import subprocess
-import tempfile
+import threading
 import json
 import re
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union, Iterator, Pattern, Callable, AbstractSet
+from contextlib import closing
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from operator import methodcaller
 from datetime import datetime
 
-from ..utils import get_logger, Config
+try:
+    # Optional: stream large bandit reports instead of loading them whole
+    import ijson
+except ImportError:
+    ijson = None
+
+from ..utils import get_logger, get_worker_log_queue, setup_worker_logging, Config
 from ..utils.helpers import (
     get_file_extension,
     is_binary_file,
@@ -24,10 +43,270 @@ from ..utils.helpers import (
     extract_imports,
     find_security_patterns,
     detect_dependencies,
-    calculate_file_hash
+    calculate_file_hash,
+    count_occurrences,
+    iter_lines,
+    json_dumps,
+    json_loads,
+    map_file
 )
 
 
+# Bump when analysis rules change so results cached on disk are recomputed
+ANALYSIS_CACHE_VERSION = '2'
+
+_ANSIBLE_FILENAMES = frozenset({
+    'playbook.yml', 'playbook.yaml', 'site.yml', 'site.yaml',
+    'main.yml', 'main.yaml'
+})
+
+_ANSIBLE_KEYWORDS = (
+    'hosts:', 'tasks:', 'handlers:', 'vars:', 'roles:',
+    'playbook:', 'become:', 'gather_facts:', 'ansible_',
+    'with_items:', 'when:', 'notify:', 'register:'
+)
+_ANSIBLE_KEYWORDS_BYTES = tuple(keyword.encode() for keyword in _ANSIBLE_KEYWORDS)
+
+_ANSIBLE_DEPRECATED_SYNTAX = (
+    ('include:', 'Use include_tasks or import_tasks instead of include'),
+    ('sudo:', 'Use become instead of sudo'),
+    ('sudo_user:', 'Use become_user instead of sudo_user'),
+    ('always_run:', 'Use check_mode instead of always_run')
+)
+
+_YAML_SECRET_RE = re.compile(r'(password|secret|key|token|api_key):\s*["\']?[a-zA-Z0-9_\-+=\/]{8,}["\']?', re.IGNORECASE)
+_URL_CREDENTIALS_RE = re.compile(r'https?://[^:]+:[^@]+@')
+_QUOTE_FILTER_RE = re.compile(r'\|\s*quote')
+_UNQUOTED_VARIABLE_RE = re.compile(r':\s*{{.*}}')
+_QUOTED_VARIABLE_RE = re.compile(r':\s*["\']{{.*}}["\']')
+_ANSIBLE_SECRET_RE = re.compile(r'(password|secret|key|token):\s*["\']?[a-zA-Z0-9]+["\']?', re.IGNORECASE)
+
+# yamllint "parsable" output: path:line:col: [level] message (rule)
+_YAMLLINT_LINE_RE = re.compile(
+    r'^(?P<path>.+?):(?P<line>\d+):(?P<col>\d+): \[(?P<level>\w+)\] (?P<desc>.*?)(?: \((?P<rule>[\w-]+)\))?$'
+)
+_YAMLLINT_BATCH_SIZE = 200
+
+# Lines after a register: searched for a when: condition; the check only
+# applies when more than this many lines follow
+_WHEN_LOOKAHEAD = 5
+
+# Per-line source patterns. Each *_PREFILTER is a cheap bytes union that matches
+# every line any of the exact patterns below it can match, so other lines are
+# skipped without being decoded. A line may hit several rules, so the exact checks
+# still run individually on the decoded lines that pass the prefilter.
+_JS_QUALITY_PREFILTER = re.compile(rb'console\.|\bvar|==')
+_JS_CONSOLE_RE = re.compile(r'console\.(log|debug|info|warn|error)')
+_JS_VAR_RE = re.compile(r'\bvar\s+\w+')
+_JS_LOOSE_EQUALITY_RE = re.compile(r'[^=!]==[^=]')
+
+_JAVA_QUALITY_PREFILTER = re.compile(rb'System\.out\.println|catch')
+_JAVA_EMPTY_CATCH_RE = re.compile(r'catch\s*\([^)]+\)\s*\{\s*\}')
+
+_PYTHON_PERFORMANCE_PREFILTER = re.compile(rb'\+=|\.append\(')
+_PYTHON_APPEND_LOOP_RE = re.compile(r'for\s+\w+\s+in\s+.*:\s*\w+\.append\(')
+
+_JS_PERFORMANCE_PREFILTER = re.compile(rb'document\.|\.indexOf\(')
+_JS_DOM_QUERY_RE = re.compile(r'document\.getElementById|document\.querySelector')
+_JS_INDEXOF_CHECK_RE = re.compile(r'\.indexOf\(.*\)\s*[><!]=?\s*-?1')
+
+# Languages and their file extensions; shared read-only by every analyzer
+_SUPPORTED_LANGUAGES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'python': ('.py', '.pyw'),
+    'javascript': ('.js', '.jsx', '.mjs'),
+    'typescript': ('.ts', '.tsx'),
+    'java': ('.java',),
+    'go': ('.go',),
+    'rust': ('.rs',),
+    'cpp': ('.cpp', '.cc', '.cxx', '.c++', '.hpp', '.h'),
+    'c': ('.c', '.h'),
+    'csharp': ('.cs',),
+    'php': ('.php',),
+    'ruby': ('.rb',),
+    'swift': ('.swift',),
+    'kotlin': ('.kt',),
+    'scala': ('.scala',),
+    'r': ('.r', '.R'),
+    'sql': ('.sql',),
+    'bash': ('.sh',),
+    'powershell': ('.ps1',),
+    'yaml': ('.yml', '.yaml'),
+    'json': ('.json',),
+    'xml': ('.xml',),
+    'html': ('.html', '.htm'),
+    'css': ('.css',),
+    'scss': ('.scss',),
+    'less': ('.less',)
+})
+
+
+def _build_extension_map(supported_languages: Mapping[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """Map each file extension to its language; the first language listed wins."""
+    ext_to_lang = {}
+    for language, extensions in supported_languages.items():
+        for ext in extensions:
+            ext_to_lang.setdefault(ext, language)
+    return ext_to_lang
+
+
+_EXT_TO_LANG = _build_extension_map(_SUPPORTED_LANGUAGES)
+
+
+# Suggestion rules in output order: (predicate over issue types, metrics and language, suggestion)
+_SUGGESTION_RULES: Tuple[Tuple[Callable[[AbstractSet[str], Dict[str, Any], str], bool], Dict[str, str]], ...] = (
+    (
+        lambda types, metrics, language: 'hardcoded_password' in types or 'hardcoded_api_key' in types,
+        {
+            'type': 'security',
+            'priority': 'high',
+            'description': 'Use environment variables or secure configuration files for secrets',
+            'category': 'best_practices'
+        }
+    ),
+    (
+        lambda types, metrics, language: metrics.get('cyclomatic_complexity', 0) > 15,
+        {
+            'type': 'refactoring',
+            'priority': 'medium',
+            'description': 'Consider breaking down complex functions into smaller, more manageable pieces',
+            'category': 'maintainability'
+        }
+    ),
+    (
+        lambda types, metrics, language: language == 'python' and 'console_statement' in types,
+        {
+            'type': 'quality',
+            'priority': 'low',
+            'description': 'Replace print statements with proper logging',
+            'category': 'best_practices'
+        }
+    ),
+    (
+        lambda types, metrics, language: language in ('javascript', 'typescript') and 'var_usage' in types,
+        {
+            'type': 'modernization',
+            'priority': 'medium',
+            'description': 'Replace var with let/const for better scoping and immutability',
+            'category': 'modern_syntax'
+        }
+    )
+)
+
+# Dependency manifests looked for at the repository root
+_DEPENDENCY_FILES = frozenset({
+    'requirements.txt', 'requirements-dev.txt', 'Pipfile',
+    'pyproject.toml', 'package.json', 'go.mod', 'Cargo.toml',
+    'pom.xml', 'build.gradle', 'composer.json'
+})
+
+# Field accessors used when tallying issues for the summary
+_ISSUE_CATEGORY = methodcaller('get', 'category')
+_ISSUE_SEVERITY = methodcaller('get', 'severity')
+
+# Score penalty per issue severity; unknown severities are charged as 'low'
+_SECURITY_PENALTIES = {'high': 20, 'medium': 10, 'low': 5}
+_QUALITY_PENALTIES = {'high': 15, 'medium': 8, 'low': 3}
+_PERFORMANCE_PENALTIES = {'high': 20, 'medium': 12, 'low': 5}
+
+
+def _severity_penalty(issues: List[Dict[str, Any]], table: Dict[str, int]) -> int:
+    """Sum the severity penalties of a list of issues."""
+    severities = [issue.get('severity', 'medium') for issue in issues]
+    
+    # map() over dict.get keeps the per-issue lookup and summation in C
+    return sum(map(table.get, severities, repeat(table['low'], len(severities))))
+
+
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+
+def _iter_bandit_results(report: bytes) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a bandit JSON report's results list, parsing them incrementally when ijson is available."""
+    if not report.strip():
+        return
+    
+    if ijson is not None:
+        yield from ijson.items(report, 'results.item', use_float=True)
+    else:
+        yield from json.loads(report).get('results', [])
+
+
+def _runs_sudo(line: str) -> bool:
+    """Check whether a shell/command line invokes sudo after the module key."""
+    start = -1
+    for key in ('shell:', 'command:'):
+        pos = line.find(key)
+        if pos != -1 and (start == -1 or pos + len(key) < start):
+            start = pos + len(key)
+    return start != -1 and line.find('sudo', start) != -1
+
+
+def _parse_mode(line: str) -> Optional[str]:
+    """Extract the numeric value of the first 'mode:' key on a line, if any."""
+    length = len(line)
+    start = line.find('mode:')
+    while start != -1:
+        pos = start + 5
+        while pos < length and line[pos].isspace():
+            pos += 1
+        if pos < length and line[pos] in '"\'':
+            pos += 1
+        end = pos
+        while end < length and line[end].isdecimal():
+            end += 1
+        if end > pos:
+            return line[pos:end]
+        start = line.find('mode:', start + 1)
+    return None
+
+
+# Nodes that can contain function definitions; expressions never do
+_STATEMENT_NODES = tuple(
+    node_type for node_type in (
+        ast.stmt, ast.excepthandler, getattr(ast, 'match_case', None)
+    ) if node_type is not None
+)
+
+
+class _FunctionArgumentsVisitor(ast.NodeVisitor):
+    """Collect functions with too many arguments, descending through statements only."""
+    
+    def __init__(self, max_arguments: int):
+        self.max_arguments = max_arguments
+        self.functions: List[ast.AST] = []
+    
+    def visit_FunctionDef(self, node: ast.AST):
+        if len(node.args.args) > self.max_arguments:
+            self.functions.append(node)
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def generic_visit(self, node: ast.AST):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _STATEMENT_NODES):
+                self.visit(child)
+
+
+# Analyzer used by pool worker processes, installed once per worker by the pool initializer
+_worker_analyzer: Optional['CodeAnalyzer'] = None
+
+
+def _init_analysis_worker(analyzer: 'CodeAnalyzer', log_queue):
+    """Install the analyzer a pool worker process uses for every file it is sent."""
+    global _worker_analyzer
+    setup_worker_logging(log_queue, analyzer.config.LOG_LEVEL)
+    _worker_analyzer = analyzer
+
+
+def _analyze_in_worker(file_path: str,
+                       tool_issues: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                       file_size: Optional[int] = None,
+                       file_hash: Optional[str] = None) -> Optional['AnalysisResult']:
+    """Analyze a file with the worker's analyzer; only the file arguments cross the process boundary."""
+    return _worker_analyzer._analyze_file_safe(file_path, tool_issues, file_size, file_hash)
+
+
 @dataclass
 class AnalysisResult:
     """Result of code analysis."""
@@ -93,38 +372,37 @@ class CodeAnalyzer:
         """Initialize the code analyzer."""
         self.config = config
         self.logger = get_logger('analyzer')
-        self.supported_languages = self._get_supported_languages()
         self.analyzers = self._setup_analyzers()
+        
+        # Results keyed by content hash; cached results are only valid for the same tool set
+        self._result_cache: Dict[Tuple[str, str, str], AnalysisResult] = {}
+        self._cache_version = f"{ANALYSIS_CACHE_VERSION}:{','.join(sorted(self.analyzers.values()))}"
+        self._cache_db = os.path.join(config.CACHE_DIR, 'analysis.sqlite') if config.ENABLE_CACHING else None
+        
+        # Parsed dependencies keyed by repository path and manifest stat signatures
+        self._dependency_cache: Dict[Tuple, Dict[str, Tuple[str, ...]]] = {}
+        
+        # File analysis pool, created on first use and kept until cleanup()
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle for the pool initializer, leaving out the pool and per-process caches."""
+        state = self.__dict__.copy()
+        state['_result_cache'] = {}
+        state['_dependency_cache'] = {}
+        del state['_executor'], state['_executor_lock']
+        return state
     
-    def _get_supported_languages(self) -> Dict[str, List[str]]:
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore a pickled analyzer without a pool of its own."""
+        self.__dict__.update(state)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
+    def _get_supported_languages(self) -> Mapping[str, Tuple[str, ...]]:
         """Get supported languages and their file extensions."""
-        return {
-            'python': ['.py', '.pyw'],
-            'javascript': ['.js', '.jsx', '.mjs'],
-            'typescript': ['.ts', '.tsx'],
-            'java': ['.java'],
-            'go': ['.go'],
-            'rust': ['.rs'],
-            'cpp': ['.cpp', '.cc', '.cxx', '.c++', '.hpp', '.h'],
-            'c': ['.c', '.h'],
-            'csharp': ['.cs'],
-            'php': ['.php'],
-            'ruby': ['.rb'],
-            'swift': ['.swift'],
-            'kotlin': ['.kt'],
-            'scala': ['.scala'],
-            'r': ['.r', '.R'],
-            'sql': ['.sql'],
-            'bash': ['.sh'],
-            'powershell': ['.ps1'],
-            'yaml': ['.yml', '.yaml'],
-            'json': ['.json'],
-            'xml': ['.xml'],
-            'html': ['.html', '.htm'],
-            'css': ['.css'],
-            'scss': ['.scss'],
-            'less': ['.less']
-        }
+        return _SUPPORTED_LANGUAGES
     
     def _setup_analyzers(self) -> Dict[str, Any]:
         """Setup language-specific analyzers."""
@@ -166,14 +444,11 @@ class CodeAnalyzer:
         
         return analyzers
     
-    def _tool_available(self, tool_name: str) -> bool:
-        """Check if a command-line tool is available."""
-        try:
-            subprocess.run([tool_name, '--version'], 
-                         capture_output=True, timeout=5)
-            return True
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _tool_available(tool_name: str) -> bool:
+        """Check if a command-line tool is available on PATH."""
+        return shutil.which(tool_name) is not None
     
     def analyze_repository(self, repo_path: str, repository_name: str) -> RepositoryAnalysis:
         """Analyze an entire repository."""
@@ -189,23 +464,16 @@ class CodeAnalyzer:
         
         self.logger.info(f"Found {len(all_files)} total files, {len(analyzable_files)} analyzable")
         
+        # Run external tools once over all candidate files instead of once per file
+        tool_issues = self._run_batch_tools(analyzable_files[:self.config.MAX_ANALYZE_FILES])
+        
         # Analyze files
-        file_results = []
+        file_results = self._analyze_files(analyzable_files, tool_issues, all_files)
         languages = {}
         
-        for file_path in analyzable_files:
-            if len(file_results) >= 100:  # Limit for performance
-                self.logger.warning("Reached file analysis limit (100 files)")
-                break
-            
-            try:
-                result = self.analyze_file(file_path)
-                if result:
-                    file_results.append(result)
-                    lang = result.language
-                    languages[lang] = languages.get(lang, 0) + 1
-            except Exception as e:
-                self.logger.error(f"Error analyzing {file_path}: {e}")
+        for result in file_results:
+            lang = result.language
+            languages[lang] = languages.get(lang, 0) + 1
         
         # Calculate overall scores
         overall_scores = self._calculate_overall_scores(file_results)
@@ -233,13 +501,180 @@ class CodeAnalyzer:
         
         return analysis
     
-    def analyze_file(self, file_path: str) -> Optional[AnalysisResult]:
-        """Analyze a single file."""
-        if not os.path.exists(file_path) or is_binary_file(file_path):
+    def _run_batch_tools(self, file_paths: List[str]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Run batch-capable tools over the given files, returning issues by file and tool."""
+        tool_issues = {}
+        
+        runners = []
+        if 'python_security' in self.analyzers:
+            runners.append(('bandit', 'python', self._run_bandit_batch))
+        if 'yaml_lint' in self.analyzers:
+            runners.append(('yamllint', 'yaml', self._run_yamllint_batch))
+        
+        if not runners:
+            return tool_issues
+        
+        languages = {file_path: self._detect_language(file_path) for file_path in file_paths}
+        for tool, language, run_batch in runners:
+            tool_files = [file_path for file_path in file_paths if languages[file_path] == language]
+            if tool_files:
+                for file_path, issues in run_batch(tool_files).items():
+                    tool_issues.setdefault(file_path, {})[tool] = issues
+        
+        return tool_issues
+    
+    def _analyze_files(self, file_paths: List[str],
+                       tool_issues: Dict[str, Dict[str, List[Dict[str, Any]]]],
+                       file_sizes: Optional[Dict[str, Optional[int]]] = None) -> List[AnalysisResult]:
+        """Analyze files across worker processes, keeping discovery order and the result limit."""
+        limit = max(0, self.config.MAX_ANALYZE_FILES)
+        file_results = []
+        remaining = iter(file_paths)
+        consumed = 0
+        
+        workers = max(1, self.config.ANALYSIS_WORKERS)
+        executor = self._get_executor(workers) if workers > 1 and len(file_paths) > 1 else None
+        fallback = None
+        
+        try:
+            # Files that turn out not to be analyzable don't count towards the limit,
+            # so keep topping up until it is reached or the files run out
+            while len(file_results) < limit:
+                batch = list(islice(remaining, limit - len(file_results)))
+                if not batch:
+                    break
+                consumed += len(batch)
+                
+                batch_tool_issues = [tool_issues.get(file_path) for file_path in batch]
+                batch_sizes = [file_sizes.get(file_path) if file_sizes else None for file_path in batch]
+                
+                if isinstance(executor, ProcessPoolExecutor):
+                    try:
+                        results = self._analyze_in_pool(executor, batch, batch_tool_issues, batch_sizes)
+                    except BrokenProcessPool as e:
+                        self.logger.warning(f"Analysis worker pool failed ({e}), continuing in threads")
+                        self._discard_executor(executor)
+                        executor = fallback = ThreadPoolExecutor(max_workers=workers)
+                        results = list(executor.map(self._analyze_file_safe, batch, batch_tool_issues, batch_sizes))
+                elif executor:
+                    results = list(executor.map(self._analyze_file_safe, batch, batch_tool_issues, batch_sizes))
+                else:
+                    results = list(map(self._analyze_file_safe, batch, batch_tool_issues, batch_sizes))
+                
+                file_results.extend(result for result in results if result)
+        finally:
+            if fallback:
+                fallback.shutdown()
+        
+        if len(file_results) >= limit and consumed < len(file_paths):
+            self.logger.warning(f"Reached file analysis limit ({limit} files)")
+        
+        return file_results
+    
+    def _analyze_in_pool(self, executor: ProcessPoolExecutor, batch: List[str],
+                         batch_tool_issues: List[Optional[Dict[str, List[Dict[str, Any]]]]],
+                         batch_sizes: List[Optional[int]]) -> List[Optional[AnalysisResult]]:
+        """Analyze a batch in worker processes, answering content seen before from the in-memory cache."""
+        results: List[Optional[AnalysisResult]] = [None] * len(batch)
+        pending = []
+        
+        # Workers cache in their own memory, so this process looks up and stores results itself;
+        # the hashes are passed on so the workers don't read the files again to compute them.
+        # Files of unknown or excessive size are left for the workers to check and hash
+        for index, file_path in enumerate(batch):
+            language = self._detect_language(file_path)
+            file_size = batch_sizes[index]
+            hashable = language and file_size is not None and file_size <= self.config.MAX_FILE_SIZE
+            file_hash = calculate_file_hash(file_path) if hashable else None
+            cached = self._result_cache.get(self._cache_key(file_path, language, file_hash)) if file_hash else None
+            if cached:
+                self.logger.debug(f"Reusing cached analysis for {file_path}")
+                results[index] = self._reuse_result(cached, file_path)
+            else:
+                pending.append((index, file_hash))
+        
+        indexes = [index for index, _ in pending]
+        analyzed = executor.map(
+            _analyze_in_worker,
+            [batch[index] for index in indexes],
+            [batch_tool_issues[index] for index in indexes],
+            [batch_sizes[index] for index in indexes],
+            [file_hash for _, file_hash in pending],
+            chunksize=4
+        )
+        for index, result in zip(indexes, analyzed):
+            results[index] = result
+            file_hash = result.metrics.get('file_hash') if result else None
+            if file_hash:
+                self._result_cache[self._cache_key(result.file_path, result.language, file_hash)] = result
+        
+        return results
+    
+    def _get_executor(self, workers: int) -> Executor:
+        """Return the shared file analysis pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = self._create_executor(workers)
+            return self._executor
+    
+    def _discard_executor(self, executor: Executor):
+        """Drop a broken pool so the next analysis starts a fresh one."""
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+    
+    def cleanup(self):
+        """Shut down the file analysis pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown()
+    
+    def _create_executor(self, workers: int) -> Executor:
+        """Create a process pool for file analysis, falling back to threads if unavailable."""
+        try:
+            # Forking this process is unsafe once it runs threads (asyncio.to_thread, the
+            # logging listener), so workers start from a clean process and get the analyzer
+            # through the initializer instead
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_analysis_worker,
+                initargs=(self, get_worker_log_queue(context))
+            )
+        except (OSError, NotImplementedError, ImportError) as e:
+            self.logger.warning(f"Process pool unavailable ({e}), analyzing files in threads")
+            return ThreadPoolExecutor(max_workers=workers)
+    
+    def _analyze_file_safe(self, file_path: str,
+                           tool_issues: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                           file_size: Optional[int] = None,
+                           file_hash: Optional[str] = None) -> Optional[AnalysisResult]:
+        """Analyze a file, logging instead of raising on unexpected errors."""
+        try:
+            return self.analyze_file(file_path, tool_issues, file_size, file_hash)
+        except Exception as e:
+            self.logger.error(f"Error analyzing {file_path}: {e}")
+            return None
+    
+    def analyze_file(self, file_path: str,
+                     tool_issues: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                     file_size: Optional[int] = None,
+                     file_hash: Optional[str] = None) -> Optional[AnalysisResult]:
+        """Analyze a single file, reusing any tool issues, size or hash already collected for it."""
+        if file_size is None:
+            if not os.path.exists(file_path):
+                return None
+            file_size = os.path.getsize(file_path)
+        
+        if is_binary_file(file_path):
             return None
         
         # Check file size
-        if os.path.getsize(file_path) > self.config.MAX_FILE_SIZE:
+        if file_size > self.config.MAX_FILE_SIZE:
             self.logger.warning(f"Skipping large file: {file_path}")
             return None
         
@@ -248,19 +683,28 @@ class CodeAnalyzer:
         if not language:
             return None
         
+        # Identical content analyzed before (in this run or a cached one) gives identical results
+        if file_hash is None:
+            file_hash = calculate_file_hash(file_path)
+        cache_key = self._cache_key(file_path, language, file_hash) if file_hash else None
+        cached = self._get_cached_result(cache_key) if cache_key else None
+        if cached:
+            self.logger.debug(f"Reusing cached analysis for {file_path}")
+            return self._reuse_result(cached, file_path)
+        
         self.logger.debug(f"Analyzing {file_path} as {language}")
         
         try:
             # Basic metrics
             metrics = calculate_complexity(file_path, language)
-            metrics['file_size'] = os.path.getsize(file_path)
-            metrics['file_hash'] = calculate_file_hash(file_path)
+            metrics['file_size'] = file_size
+            metrics['file_hash'] = file_hash
             
             # Security analysis
-            security_issues = self._analyze_security(file_path, language)
+            security_issues = self._analyze_security(file_path, language, tool_issues)
             
             # Quality analysis
-            quality_issues = self._analyze_quality(file_path, language)
+            quality_issues = self._analyze_quality(file_path, language, tool_issues)
             
             # Performance analysis
             performance_issues = self._analyze_performance(file_path, language)
@@ -268,15 +712,22 @@ class CodeAnalyzer:
             # Combine all issues
             all_issues = security_issues + quality_issues + performance_issues
             
-            # Calculate scores
-            security_score = self._calculate_security_score(security_issues, metrics)
-            quality_score = self._calculate_quality_score(quality_issues, metrics)
-            performance_score = self._calculate_performance_score(performance_issues, metrics)
+            # Calculate scores; each score only counts its own pass's issues of its own
+            # category (ansible-lint and hardcoded ansible secrets report across passes)
+            security_score = self._calculate_security_score(
+                self._issues_in_category(security_issues, 'security'), metrics
+            )
+            quality_score = self._calculate_quality_score(
+                self._issues_in_category(quality_issues, 'quality'), metrics
+            )
+            performance_score = self._calculate_performance_score(
+                self._issues_in_category(performance_issues, 'performance'), metrics
+            )
             
             # Generate suggestions
             suggestions = self._generate_suggestions(all_issues, metrics, language)
             
-            return AnalysisResult(
+            result = AnalysisResult(
                 file_path=file_path,
                 language=language,
                 issues=all_issues,
@@ -291,47 +742,149 @@ class CodeAnalyzer:
         except Exception as e:
             self.logger.error(f"Error analyzing file {file_path}: {e}")
             return None
+        
+        if cache_key:
+            self._store_cached_result(cache_key, result)
+        
+        return result
     
-    def _discover_files(self, repo_path: str) -> List[str]:
-        """Discover all files in a repository."""
-        files = []
+    @staticmethod
+    def _cache_key(file_path: str, language: str, file_hash: str) -> Tuple[str, str, str]:
+        """Key results by content; YAML results also depend on the file name through Ansible playbook detection."""
+        file_name = os.path.basename(file_path).lower() if language == 'yaml' else ''
+        return (file_hash, language, file_name)
+    
+    @staticmethod
+    def _reuse_result(cached: AnalysisResult, file_path: str) -> AnalysisResult:
+        """Copy a cached result for another file with the same content."""
+        return replace(
+            cached,
+            file_path=file_path,
+            issues=copy.deepcopy(cached.issues),
+            metrics=copy.deepcopy(cached.metrics),
+            suggestions=copy.deepcopy(cached.suggestions),
+            timestamp=datetime.now()
+        )
+    
+    def _get_cached_result(self, cache_key: Tuple[str, str, str]) -> Optional[AnalysisResult]:
+        """Look up a previous result for the same content, in memory first and then on disk."""
+        result = self._result_cache.get(cache_key)
+        if result or not self._cache_db:
+            return result
         
-        for root, dirs, filenames in os.walk(repo_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if not self.config.is_file_excluded(d)]
-            
-            for filename in filenames:
-                file_path = os.path.join(root, filename)
-                if not self.config.is_file_excluded(file_path):
-                    files.append(file_path)
+        try:
+            with closing(self._connect_cache_db()) as conn:
+                row = conn.execute(
+                    'SELECT result FROM analysis_results '
+                    'WHERE file_hash = ? AND language = ? AND file_name = ? AND version = ?',
+                    (*cache_key, self._cache_version)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.debug(f"Analysis cache lookup failed: {e}")
+            return None
+        
+        if not row:
+            return None
+        
+        data = json_loads(row[0])
+        result = AnalysisResult(
+            file_path=data['file_path'],
+            language=cache_key[1],
+            issues=data['issues'],
+            metrics=data['metrics'],
+            suggestions=data['suggestions'],
+            security_score=data['security_score'],
+            quality_score=data['quality_score'],
+            performance_score=data['performance_score'],
+            timestamp=datetime.now()
+        )
+        self._result_cache[cache_key] = result
+        return result
+    
+    def _store_cached_result(self, cache_key: Tuple[str, str, str], result: AnalysisResult):
+        """Remember a result in memory and, if caching is enabled, persist it to disk."""
+        self._result_cache[cache_key] = result
+        if not self._cache_db:
+            return
+        
+        data = json_dumps({
+            'file_path': result.file_path,
+            'issues': result.issues,
+            'metrics': result.metrics,
+            'suggestions': result.suggestions,
+            'security_score': result.security_score,
+            'quality_score': result.quality_score,
+            'performance_score': result.performance_score
+        }).decode('utf-8')
         
-        return files
+        try:
+            with closing(self._connect_cache_db()) as conn, conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO analysis_results '
+                    '(file_hash, language, file_name, version, result) VALUES (?, ?, ?, ?, ?)',
+                    (*cache_key, self._cache_version, data)
+                )
+        except sqlite3.Error as e:
+            self.logger.debug(f"Analysis cache write failed: {e}")
+    
+    def _connect_cache_db(self) -> sqlite3.Connection:
+        """Open the on-disk analysis cache, creating its table if needed."""
+        conn = sqlite3.connect(self._cache_db, timeout=5)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS analysis_results ('
+            'file_hash TEXT, language TEXT, file_name TEXT, version TEXT, result TEXT, '
+            'PRIMARY KEY (file_hash, language, file_name, version))'
+        )
+        return conn
+    
+    def _discover_files(self, repo_path: str) -> Dict[str, Optional[int]]:
+        """Discover all files in a repository, mapped to their size in bytes."""
+        return dict(self._walk_files(repo_path))
+    
+    def _walk_files(self, directory: str) -> Iterator[Tuple[str, Optional[int]]]:
+        """Yield (path, size) for files under a directory in os.walk order, reusing scandir's stat cache."""
+        files = []
+        subdirs = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        # Skip excluded directories without descending; like os.walk, don't follow symlinks
+                        if not self.config.is_file_excluded(entry.name) and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif not self.config.is_file_excluded(entry.path):
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = None
+                        files.append((entry.path, size))
+        except OSError:
+            return
+        
+        yield from files
+        for subdir in subdirs:
+            yield from self._walk_files(subdir)
     
     def _is_analyzable(self, file_path: str) -> bool:
         """Check if a file can be analyzed."""
-        if is_binary_file(file_path):
+        # Check if extension is supported before touching the file
+        if get_file_extension(file_path) not in _EXT_TO_LANG:
             return False
         
-        ext = get_file_extension(file_path)
-        
-        # Check if extension is supported
-        for language, extensions in self.supported_languages.items():
-            if ext in extensions:
-                return True
-        
-        return False
+        return not is_binary_file(file_path)
     
     def _detect_language(self, file_path: str) -> Optional[str]:
         """Detect the programming language of a file."""
-        ext = get_file_extension(file_path)
-        
-        for language, extensions in self.supported_languages.items():
-            if ext in extensions:
-                return language
-        
-        return None
+        return _EXT_TO_LANG.get(get_file_extension(file_path))
     
-    def _analyze_security(self, file_path: str, language: str) -> List[Dict[str, Any]]:
+    def _analyze_security(self, file_path: str, language: str,
+                          tool_issues: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
         """Analyze file for security issues."""
         issues = []
         
@@ -350,20 +903,24 @@ class CodeAnalyzer:
         
         # Tool-based analysis
         if language == 'python' and 'python_security' in self.analyzers:
-            tool_issues = self._run_bandit(file_path)
-            issues.extend(tool_issues)
+            if tool_issues and 'bandit' in tool_issues:
+                bandit_issues = tool_issues['bandit']
+            else:
+                bandit_issues = self._run_bandit(file_path)
+            issues.extend(bandit_issues)
         elif language == 'yaml':
             yaml_security_issues = self._analyze_yaml_security(file_path)
             issues.extend(yaml_security_issues)
             
             # Run additional YAML tools if available
-            if 'ansible_lint' in self.analyzers and self._is_ansible_file(file_path, open(file_path).read()):
+            if 'ansible_lint' in self.analyzers and self._is_ansible_file_path(file_path):
                 ansible_issues = self._run_ansible_lint(file_path)
                 issues.extend(ansible_issues)
         
         return issues
     
-    def _analyze_quality(self, file_path: str, language: str) -> List[Dict[str, Any]]:
+    def _analyze_quality(self, file_path: str, language: str,
+                         tool_issues: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
         """Analyze file for quality issues."""
         issues = []
         
@@ -379,7 +936,10 @@ class CodeAnalyzer:
             
             # Run YAML linting tools if available
             if 'yaml_lint' in self.analyzers:
-                yaml_issues = self._run_yamllint(file_path)
+                if tool_issues and 'yamllint' in tool_issues:
+                    yaml_issues = tool_issues['yamllint']
+                else:
+                    yaml_issues = self._run_yamllint(file_path)
                 issues.extend(yaml_issues)
         
         return issues
@@ -400,37 +960,40 @@ class CodeAnalyzer:
     
     def _run_bandit(self, file_path: str) -> List[Dict[str, Any]]:
         """Run bandit security analysis on Python file."""
-        issues = []
+        return self._run_bandit_batch([file_path]).get(file_path, [])
+    
+    def _run_bandit_batch(self, file_paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run bandit once over many Python files and group issues by file path."""
+        issues_by_file = {file_path: [] for file_path in file_paths}
+        
+        # bandit reports paths in its own normalised form (e.g. with a leading "./")
+        requested = {os.path.normpath(file_path): file_path for file_path in file_paths}
         
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                temp_output = temp_file.name
-            
-            cmd = ['bandit', '-f', 'json', '-o', temp_output, file_path]
-            result = subprocess.run(cmd, capture_output=True, timeout=30)
+            # The JSON report goes to stdout; bandit logs to stderr
+            cmd = ['bandit', '-f', 'json', *file_paths]
+            result = subprocess.run(cmd, capture_output=True, timeout=30 * len(file_paths))
             
-            if os.path.exists(temp_output):
-                with open(temp_output, 'r') as f:
-                    bandit_output = json.load(f)
-                
-                for result_item in bandit_output.get('results', []):
-                    issues.append({
-                        'category': 'security',
-                        'type': result_item.get('test_id', 'unknown'),
-                        'severity': result_item.get('issue_severity', 'medium').lower(),
-                        'description': result_item.get('issue_text', ''),
-                        'line': result_item.get('line_number', 0),
-                        'code': result_item.get('code', ''),
-                        'tool': 'bandit',
-                        'confidence': result_item.get('issue_confidence', 'medium').lower()
-                    })
+            for result_item in _iter_bandit_results(result.stdout):
+                file_path = requested.get(os.path.normpath(result_item.get('filename', '')))
+                if file_path is None:
+                    continue
                 
-                os.unlink(temp_output)
+                issues_by_file[file_path].append({
+                    'category': 'security',
+                    'type': result_item.get('test_id', 'unknown'),
+                    'severity': result_item.get('issue_severity', 'medium').lower(),
+                    'description': result_item.get('issue_text', ''),
+                    'line': result_item.get('line_number', 0),
+                    'code': result_item.get('code', ''),
+                    'tool': 'bandit',
+                    'confidence': result_item.get('issue_confidence', 'medium').lower()
+                })
         
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired, json.JSONDecodeError) as e:
-            self.logger.warning(f"Bandit analysis failed for {file_path}: {e}")
+        except (subprocess.SubprocessError, subprocess.TimeoutExpired, OSError, *_JSON_ERRORS) as e:
+            self.logger.warning(f"Bandit analysis failed for {len(file_paths)} file(s): {e}")
         
-        return issues
+        return issues_by_file
     
     def _run_ansible_lint(self, file_path: str) -> List[Dict[str, Any]]:
         """Run ansible-lint on Ansible YAML files."""
@@ -475,34 +1038,39 @@ class CodeAnalyzer:
     
     def _run_yamllint(self, file_path: str) -> List[Dict[str, Any]]:
         """Run yamllint on YAML files."""
-        issues = []
+        return self._run_yamllint_batch([file_path]).get(file_path, [])
+    
+    def _run_yamllint_batch(self, file_paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run yamllint once over many YAML files and group issues by file path."""
+        issues_by_file = {file_path: [] for file_path in file_paths}
         
-        try:
-            cmd = ['yamllint', '-f', 'json', file_path]
-            result = subprocess.run(cmd, capture_output=True, timeout=30, text=True)
+        for start in range(0, len(file_paths), _YAMLLINT_BATCH_SIZE):
+            batch = file_paths[start:start + _YAMLLINT_BATCH_SIZE]
+            try:
+                cmd = ['yamllint', '-f', 'parsable', *batch]
+                result = subprocess.run(cmd, capture_output=True, timeout=30 + len(batch), text=True)
+                
+                for line in result.stdout.splitlines():
+                    match = _YAMLLINT_LINE_RE.match(line)
+                    if not match or match.group('path') not in issues_by_file:
+                        continue
+                    
+                    rule = match.group('rule') or 'unknown'
+                    issues_by_file[match.group('path')].append({
+                        'category': 'quality',
+                        'type': f"yaml_lint_{rule}",
+                        'severity': self._map_yamllint_severity(match.group('level')),
+                        'description': match.group('desc'),
+                        'line': int(match.group('line')),
+                        'code': '',
+                        'tool': 'yamllint',
+                        'rule': match.group('rule') or ''
+                    })
             
-            if result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            issue = json.loads(line)
-                            issues.append({
-                                'category': 'quality',
-                                'type': f"yaml_lint_{issue.get('type', 'unknown')}",
-                                'severity': self._map_yamllint_severity(issue.get('level', 'warning')),
-                                'description': issue.get('desc', 'YAML lint issue'),
-                                'line': issue.get('line', 0),
-                                'code': '',
-                                'tool': 'yamllint',
-                                'rule': issue.get('rule', '')
-                            })
-                        except json.JSONDecodeError:
-                            continue
+            except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
+                self.logger.warning(f"Yamllint analysis failed for {len(batch)} file(s): {e}")
         
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
-            self.logger.warning(f"Yamllint analysis failed for {file_path}: {e}")
-        
-        return issues
+        return issues_by_file
     
     def _map_ansible_lint_severity(self, level: str) -> str:
         """Map ansible-lint severity levels to our standard levels."""
@@ -525,6 +1093,32 @@ class CodeAnalyzer:
         }
         return mapping.get(level.lower(), 'medium')
     
+    def _scan_lines(self, file_path: str, prefilter: Pattern[bytes]) -> Iterator[Tuple[int, str]]:
+        """Yield (line number, decoded line) for each line of a file containing a prefilter match."""
+        with map_file(file_path) as buf:
+            line_num = 1
+            counted = 0
+            
+            # Let the regex engine skip over non-matching lines in one scan of the whole buffer
+            # instead of testing every line from Python
+            match = prefilter.search(buf)
+            while match:
+                line_start = buf.rfind(b'\n', 0, match.start()) + 1
+                line_end = buf.find(b'\n', match.start())
+                if line_end == -1:
+                    line_end = len(buf)
+                
+                line_num += buf[counted:line_start].count(b'\n')
+                counted = line_start
+                
+                line = buf[line_start:line_end]
+                if line.endswith(b'\r'):
+                    line = line[:-1]
+                yield line_num, line.decode('utf-8', 'ignore')
+                
+                # One hit per line is enough; the caller runs the exact rules on it
+                match = prefilter.search(buf, line_end + 1)
+    
     def _analyze_python_quality(self, file_path: str) -> List[Dict[str, Any]]:
         """Analyze Python file for quality issues."""
         issues = []
@@ -533,36 +1127,37 @@ class CodeAnalyzer:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
             
+            # Long line length (simple check), reported once per line; line lengths
+            # are measured in one C-level pass and most files have no long lines
+            line_lengths = list(map(len, content.split('\n')))
+            if max(line_lengths) > 120:
+                for i, length in enumerate(line_lengths, 1):
+                    if length > 120:
+                        issues.append({
+                            'category': 'quality',
+                            'type': 'long_line',
+                            'severity': 'low',
+                            'description': f'Line length {length} exceeds 120 characters',
+                            'line': i,
+                            'tool': 'ast_analysis'
+                        })
+            
             # AST-based analysis
             try:
                 tree = ast.parse(content)
                 
-                # Check for common quality issues
-                for node in ast.walk(tree):
-                    # Too many arguments
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        if len(node.args.args) > 7:
-                            issues.append({
-                                'category': 'quality',
-                                'type': 'too_many_arguments',
-                                'severity': 'medium',
-                                'description': f'Function has {len(node.args.args)} arguments (max recommended: 7)',
-                                'line': node.lineno,
-                                'tool': 'ast_analysis'
-                            })
-                    
-                    # Long line length (simple check)
-                    if hasattr(node, 'lineno'):
-                        line = content.split('\n')[node.lineno - 1] if node.lineno <= len(content.split('\n')) else ''
-                        if len(line) > 120:
-                            issues.append({
-                                'category': 'quality',
-                                'type': 'long_line',
-                                'severity': 'low',
-                                'description': f'Line length {len(line)} exceeds 120 characters',
-                                'line': node.lineno,
-                                'tool': 'ast_analysis'
-                            })
+                # Too many arguments
+                visitor = _FunctionArgumentsVisitor(max_arguments=7)
+                visitor.visit(tree)
+                for node in visitor.functions:
+                    issues.append({
+                        'category': 'quality',
+                        'type': 'too_many_arguments',
+                        'severity': 'medium',
+                        'description': f'Function has {len(node.args.args)} arguments (max recommended: 7)',
+                        'line': node.lineno,
+                        'tool': 'ast_analysis'
+                    })
             
             except SyntaxError as e:
                 issues.append({
@@ -584,14 +1179,9 @@ class CodeAnalyzer:
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
+            for i, line in self._scan_lines(file_path, _JS_QUALITY_PREFILTER):
                 # Check for console.log statements
-                if re.search(r'console\.(log|debug|info|warn|error)', line):
+                if _JS_CONSOLE_RE.search(line):
                     issues.append({
                         'category': 'quality',
                         'type': 'console_statement',
@@ -603,7 +1193,7 @@ class CodeAnalyzer:
                     })
                 
                 # Check for var usage (prefer let/const)
-                if re.search(r'\bvar\s+\w+', line):
+                if _JS_VAR_RE.search(line):
                     issues.append({
                         'category': 'quality',
                         'type': 'var_usage',
@@ -615,7 +1205,7 @@ class CodeAnalyzer:
                     })
                 
                 # Check for == usage (prefer ===)
-                if re.search(r'[^=!]==[^=]', line):
+                if _JS_LOOSE_EQUALITY_RE.search(line):
                     issues.append({
                         'category': 'quality',
                         'type': 'loose_equality',
@@ -636,12 +1226,7 @@ class CodeAnalyzer:
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
+            for i, line in self._scan_lines(file_path, _JAVA_QUALITY_PREFILTER):
                 # Check for System.out.println
                 if 'System.out.println' in line:
                     issues.append({
@@ -655,7 +1240,7 @@ class CodeAnalyzer:
                     })
                 
                 # Check for empty catch blocks
-                if re.search(r'catch\s*\([^)]+\)\s*\{\s*\}', line):
+                if _JAVA_EMPTY_CATCH_RE.search(line):
                     issues.append({
                         'category': 'quality',
                         'type': 'empty_catch',
@@ -676,12 +1261,7 @@ class CodeAnalyzer:
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
+            for i, line in self._scan_lines(file_path, _PYTHON_PERFORMANCE_PREFILTER):
                 # Check for string concatenation in loops
                 if '+=' in line and any(keyword in line for keyword in ['for ', 'while ']):
                     issues.append({
@@ -695,7 +1275,7 @@ class CodeAnalyzer:
                     })
                 
                 # Check for list comprehension opportunities
-                if re.search(r'for\s+\w+\s+in\s+.*:\s*\w+\.append\(', line):
+                if _PYTHON_APPEND_LOOP_RE.search(line):
                     issues.append({
                         'category': 'performance',
                         'type': 'list_comprehension_opportunity',
@@ -716,14 +1296,9 @@ class CodeAnalyzer:
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
+            for i, line in self._scan_lines(file_path, _JS_PERFORMANCE_PREFILTER):
                 # Check for inefficient DOM queries
-                if re.search(r'document\.getElementById|document\.querySelector', line):
+                if _JS_DOM_QUERY_RE.search(line):
                     if 'for' in line or 'while' in line:
                         issues.append({
                             'category': 'performance',
@@ -736,7 +1311,7 @@ class CodeAnalyzer:
                         })
                 
                 # Check for inefficient array methods
-                if re.search(r'\.indexOf\(.*\)\s*[><!]=?\s*-?1', line):
+                if _JS_INDEXOF_CHECK_RE.search(line):
                     issues.append({
                         'category': 'performance',
                         'type': 'inefficient_array_search',
@@ -757,288 +1332,309 @@ class CodeAnalyzer:
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            is_ansible = self._is_ansible_file(file_path, content)
-            
-            for i, line in enumerate(lines, 1):
-                # General YAML security issues
+            with map_file(file_path) as buf:
+                is_ansible = self._is_ansible_file(file_path, buf)
+                has_become = buf.find(b'become:') != -1
                 
-                # Check for hardcoded secrets
-                if re.search(r'(password|secret|key|token|api_key):\s*["\']?[a-zA-Z0-9_\-+=\/]{8,}["\']?', line, re.IGNORECASE):
-                    issues.append({
-                        'category': 'security',
-                        'type': 'hardcoded_secret',
-                        'severity': 'high',
-                        'description': 'Hardcoded secret or credential detected',
-                        'line': i,
-                        'code': line.strip(),
-                        'tool': 'yaml_security_analysis'
-                    })
+                # Pick the line checker once instead of branching on every line
+                check_line = self._check_ansible_security_line if is_ansible else self._check_yaml_security_line
                 
-                # Check for URLs with credentials
-                if re.search(r'https?://[^:]+:[^@]+@', line):
-                    issues.append({
-                        'category': 'security',
-                        'type': 'url_with_credentials',
-                        'severity': 'high',
-                        'description': 'URL contains embedded credentials',
-                        'line': i,
-                        'code': line.strip(),
-                        'tool': 'yaml_security_analysis'
-                    })
-                
-                # Ansible-specific security checks
-                if is_ansible:
-                    # Check for shell commands with user input
-                    if re.search(r'(shell|command):', line):
-                        if '{{' in line and any(unsafe in line.lower() for unsafe in ['user_input', 'ansible_user', 'item']):
-                            issues.append({
-                                'category': 'security',
-                                'type': 'ansible_shell_injection',
-                                'severity': 'high',
-                                'description': 'Potential shell injection via unescaped user input',
-                                'line': i,
-                                'code': line.strip(),
-                                'tool': 'ansible_security_analysis'
-                            })
-                    
-                    # Check for privilege escalation without become
-                    if re.search(r'(shell|command):.*sudo', line) and 'become:' not in content:
-                        issues.append({
-                            'category': 'security',
-                            'type': 'ansible_unsafe_sudo',
-                            'severity': 'medium',
-                            'description': 'Use become instead of sudo in shell commands',
-                            'line': i,
-                            'code': line.strip(),
-                            'tool': 'ansible_security_analysis'
-                        })
-                    
-                    # Check for file permissions issues
-                    if 'mode:' in line:
-                        mode_match = re.search(r'mode:\s*["\']?(\d+)["\']?', line)
-                        if mode_match:
-                            mode = mode_match.group(1)
-                            if len(mode) == 3 and mode.endswith('7'):  # World writable
-                                issues.append({
-                                    'category': 'security',
-                                    'type': 'ansible_world_writable',
-                                    'severity': 'medium',
-                                    'description': 'File/directory is world-writable, consider restricting permissions',
-                                    'line': i,
-                                    'code': line.strip(),
-                                    'tool': 'ansible_security_analysis'
-                                })
-                    
-                    # Check for unsafe file operations
-                    if 'src:' in line and '{{' in line:
-                        if not re.search(r'\|\s*quote', line):  # No quote filter
-                            issues.append({
-                                'category': 'security',
-                                'type': 'ansible_unquoted_src',
-                                'severity': 'medium',
-                                'description': 'Use quote filter for dynamic file paths to prevent injection',
-                                'line': i,
-                                'code': line.strip(),
-                                'tool': 'ansible_security_analysis'
-                            })
-                    
-                    # Check for debug tasks that might leak sensitive info
-                    if 'debug:' in line and ('var:' in line or 'msg:' in line):
-                        if any(sensitive in line.lower() for sensitive in ['password', 'secret', 'key', 'token']):
-                            issues.append({
-                                'category': 'security',
-                                'type': 'ansible_debug_sensitive',
-                                'severity': 'medium',
-                                'description': 'Debug statement might expose sensitive information',
-                                'line': i,
-                                'code': line.strip(),
-                                'tool': 'ansible_security_analysis'
-                            })
-                    
-                    # Check for missing no_log on sensitive tasks
-                    if any(module in line for module in ['user:', 'mysql_user:', 'postgresql_user:']):
-                        if 'password' in line and 'no_log:' not in content[max(0, content.rfind('\n', 0, content.find(line))):content.find(line) + len(line) + 200]:
-                            issues.append({
-                                'category': 'security',
-                                'type': 'ansible_missing_no_log',
-                                'severity': 'high',
-                                'description': 'Tasks with passwords should use no_log: true',
-                                'line': i,
-                                'code': line.strip(),
-                                'tool': 'ansible_security_analysis'
-                            })
+                for i, (offset, raw_line) in enumerate(iter_lines(buf), 1):
+                    check_line(issues, raw_line.decode('utf-8', 'ignore'), i, buf, offset, has_become)
         
         except Exception as e:
             self.logger.warning(f"YAML security analysis failed for {file_path}: {e}")
         
         return issues
     
+    def _check_yaml_security_line(self, issues: List[Dict[str, Any]], line: str, line_num: int,
+                                  buf: Union[bytes, mmap.mmap], offset: int, has_become: bool) -> None:
+        """Check a single line of plain YAML for security issues."""
+        # Check for hardcoded secrets
+        if _YAML_SECRET_RE.search(line):
+            issues.append({
+                'category': 'security',
+                'type': 'hardcoded_secret',
+                'severity': 'high',
+                'description': 'Hardcoded secret or credential detected',
+                'line': line_num,
+                'code': line.strip(),
+                'tool': 'yaml_security_analysis'
+            })
+        
+        # Check for URLs with credentials
+        if _URL_CREDENTIALS_RE.search(line):
+            issues.append({
+                'category': 'security',
+                'type': 'url_with_credentials',
+                'severity': 'high',
+                'description': 'URL contains embedded credentials',
+                'line': line_num,
+                'code': line.strip(),
+                'tool': 'yaml_security_analysis'
+            })
+    
+    def _check_ansible_security_line(self, issues: List[Dict[str, Any]], line: str, line_num: int,
+                                     buf: Union[bytes, mmap.mmap], offset: int, has_become: bool) -> None:
+        """Check a single line of an Ansible file for generic and Ansible-specific security issues."""
+        self._check_yaml_security_line(issues, line, line_num, buf, offset, has_become)
+        
+        stripped = line.strip()
+        line_lower = line.lower()
+        
+        # Check for shell commands with user input
+        if 'shell:' in line or 'command:' in line:
+            if '{{' in line and any(unsafe in line_lower for unsafe in ['user_input', 'ansible_user', 'item']):
+                issues.append({
+                    'category': 'security',
+                    'type': 'ansible_shell_injection',
+                    'severity': 'high',
+                    'description': 'Potential shell injection via unescaped user input',
+                    'line': line_num,
+                    'code': stripped,
+                    'tool': 'ansible_security_analysis'
+                })
+        
+        # Check for privilege escalation without become
+        if not has_become and _runs_sudo(line):
+            issues.append({
+                'category': 'security',
+                'type': 'ansible_unsafe_sudo',
+                'severity': 'medium',
+                'description': 'Use become instead of sudo in shell commands',
+                'line': line_num,
+                'code': stripped,
+                'tool': 'ansible_security_analysis'
+            })
+        
+        # Check for file permissions issues
+        if 'mode:' in line:
+            mode = _parse_mode(line)
+            if mode:
+                if len(mode) == 3 and mode.endswith('7'):  # World writable
+                    issues.append({
+                        'category': 'security',
+                        'type': 'ansible_world_writable',
+                        'severity': 'medium',
+                        'description': 'File/directory is world-writable, consider restricting permissions',
+                        'line': line_num,
+                        'code': stripped,
+                        'tool': 'ansible_security_analysis'
+                    })
+        
+        # Check for unsafe file operations
+        if 'src:' in line and '{{' in line:
+            if not _QUOTE_FILTER_RE.search(line):  # No quote filter
+                issues.append({
+                    'category': 'security',
+                    'type': 'ansible_unquoted_src',
+                    'severity': 'medium',
+                    'description': 'Use quote filter for dynamic file paths to prevent injection',
+                    'line': line_num,
+                    'code': stripped,
+                    'tool': 'ansible_security_analysis'
+                })
+        
+        # Check for debug tasks that might leak sensitive info
+        if 'debug:' in line and ('var:' in line or 'msg:' in line):
+            if any(sensitive in line_lower for sensitive in ['password', 'secret', 'key', 'token']):
+                issues.append({
+                    'category': 'security',
+                    'type': 'ansible_debug_sensitive',
+                    'severity': 'medium',
+                    'description': 'Debug statement might expose sensitive information',
+                    'line': line_num,
+                    'code': stripped,
+                    'tool': 'ansible_security_analysis'
+                })
+        
+        # Check for missing no_log on sensitive tasks
+        if any(module in line for module in ['user:', 'mysql_user:', 'postgresql_user:']):
+            if 'password' in line and buf.find(b'no_log:', offset, offset + len(line) + 200) == -1:
+                issues.append({
+                    'category': 'security',
+                    'type': 'ansible_missing_no_log',
+                    'severity': 'high',
+                    'description': 'Tasks with passwords should use no_log: true',
+                    'line': line_num,
+                    'code': stripped,
+                    'tool': 'ansible_security_analysis'
+                })
+    
     def _analyze_yaml_quality(self, file_path: str) -> List[Dict[str, Any]]:
         """Analyze YAML file for quality and Ansible-specific issues."""
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            is_ansible = self._is_ansible_file(file_path, content)
-            
-            for i, line in enumerate(lines, 1):
-                # Basic YAML quality checks
-                
-                # Check for tabs (YAML should use spaces)
-                if '\t' in line:
-                    issues.append({
-                        'category': 'quality',
-                        'type': 'yaml_tabs',
-                        'severity': 'medium',
-                        'description': 'YAML files should use spaces, not tabs for indentation',
-                        'line': i,
-                        'code': line.rstrip(),
-                        'tool': 'yaml_analysis'
-                    })
+            with map_file(file_path) as buf:
+                is_ansible = self._is_ansible_file(file_path, buf)
                 
-                # Check for trailing whitespace
-                if line.rstrip() != line and line.strip():
-                    issues.append({
-                        'category': 'quality',
-                        'type': 'trailing_whitespace',
-                        'severity': 'low',
-                        'description': 'Remove trailing whitespace',
-                        'line': i,
-                        'code': line.rstrip(),
-                        'tool': 'yaml_analysis'
-                    })
+                # yamllint already reports tabs, trailing whitespace and indentation
+                if 'yaml_lint' in self.analyzers:
+                    check_line = self._check_ansible_only_quality_line if is_ansible else None
+                else:
+                    check_line = self._check_ansible_quality_line if is_ansible else self._check_yaml_quality_line
                 
-                # Check for inconsistent indentation (not multiple of 2)
-                if line.strip() and line.startswith(' '):
-                    indent_level = len(line) - len(line.lstrip())
-                    if indent_level % 2 != 0:
-                        issues.append({
-                            'category': 'quality',
-                            'type': 'inconsistent_indentation',
-                            'severity': 'medium',
-                            'description': 'YAML indentation should be consistent (multiples of 2 spaces)',
-                            'line': i,
-                            'code': line.rstrip(),
-                            'tool': 'yaml_analysis'
-                        })
+                if check_line:
+                    for i, (_, raw_line) in enumerate(iter_lines(buf), 1):
+                        check_line(issues, raw_line.decode('utf-8', 'ignore'), i)
                 
-                # Ansible-specific quality checks
+                # Check overall YAML structure
                 if is_ansible:
-                    issues.extend(self._analyze_ansible_quality_line(line, i))
-            
-            # Check overall YAML structure
-            if is_ansible:
-                issues.extend(self._analyze_ansible_structure(content, file_path))
+                    issues.extend(self._analyze_ansible_structure(buf, file_path))
             
         except Exception as e:
             self.logger.warning(f"YAML quality analysis failed for {file_path}: {e}")
         
         return issues
     
+    def _check_yaml_quality_line(self, issues: List[Dict[str, Any]], line: str, line_num: int) -> None:
+        """Check a single line of plain YAML for quality issues."""
+        stripped = line.strip()
+        rstripped = line.rstrip()
+        
+        # Check for tabs (YAML should use spaces)
+        if '\t' in line:
+            issues.append({
+                'category': 'quality',
+                'type': 'yaml_tabs',
+                'severity': 'medium',
+                'description': 'YAML files should use spaces, not tabs for indentation',
+                'line': line_num,
+                'code': rstripped,
+                'tool': 'yaml_analysis'
+            })
+        
+        # Check for trailing whitespace
+        if rstripped != line and stripped:
+            issues.append({
+                'category': 'quality',
+                'type': 'trailing_whitespace',
+                'severity': 'low',
+                'description': 'Remove trailing whitespace',
+                'line': line_num,
+                'code': rstripped,
+                'tool': 'yaml_analysis'
+            })
+        
+        # Check for inconsistent indentation (not multiple of 2)
+        if stripped and line.startswith(' '):
+            indent_level = len(line) - len(line.lstrip())
+            if indent_level % 2 != 0:
+                issues.append({
+                    'category': 'quality',
+                    'type': 'inconsistent_indentation',
+                    'severity': 'medium',
+                    'description': 'YAML indentation should be consistent (multiples of 2 spaces)',
+                    'line': line_num,
+                    'code': rstripped,
+                    'tool': 'yaml_analysis'
+                })
+    
+    def _check_ansible_quality_line(self, issues: List[Dict[str, Any]], line: str, line_num: int) -> None:
+        """Check a single line of an Ansible file for generic and Ansible-specific quality issues."""
+        self._check_yaml_quality_line(issues, line, line_num)
+        issues.extend(self._analyze_ansible_quality_line(line, line_num))
+    
+    def _check_ansible_only_quality_line(self, issues: List[Dict[str, Any]], line: str, line_num: int) -> None:
+        """Check a single line of an Ansible file for Ansible-specific quality issues only."""
+        issues.extend(self._analyze_ansible_quality_line(line, line_num))
+    
     def _analyze_yaml_performance(self, file_path: str) -> List[Dict[str, Any]]:
         """Analyze YAML file for performance issues."""
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            is_ansible = self._is_ansible_file(file_path, content)
-            
-            if is_ansible:
-                lines = content.split('\n')
+            with map_file(file_path) as buf:
+                if not self._is_ansible_file(file_path, buf):
+                    return issues
                 
-                for i, line in enumerate(lines, 1):
-                    # Check for inefficient Ansible patterns
-                    
-                    # Using shell/command when modules exist
-                    if re.search(r'shell:|command:', line):
-                        if any(cmd in line.lower() for cmd in ['apt ', 'yum ', 'pip ', 'git clone', 'systemctl']):
-                            issues.append({
-                                'category': 'performance',
-                                'type': 'ansible_inefficient_module',
-                                'severity': 'medium',
-                                'description': 'Consider using specific Ansible modules instead of shell/command',
-                                'line': i,
-                                'code': line.strip(),
-                                'tool': 'ansible_analysis'
-                            })
-                    
-                    # Missing when conditions for optimization
-                    if 'register:' in line and i < len(lines) - 5:
-                        next_lines = lines[i:i+5]
-                        if not any('when:' in next_line for next_line in next_lines):
-                            issues.append({
-                                'category': 'performance',
-                                'type': 'ansible_missing_when',
-                                'severity': 'low',
-                                'description': 'Consider adding when conditions to skip unnecessary tasks',
-                                'line': i,
-                                'code': line.strip(),
-                                'tool': 'ansible_analysis'
-                            })
-                    
-                    # Inefficient loops
-                    if 'with_items:' in line:
-                        issues.append({
-                            'category': 'performance',
-                            'type': 'ansible_deprecated_loop',
-                            'severity': 'medium',
-                            'description': 'with_items is deprecated, use loop instead',
-                            'line': i,
-                            'code': line.strip(),
-                            'tool': 'ansible_analysis'
-                        })
+                # Stream lines with a small lookahead window for the register/when check
+                window = deque()
+                for i, (_, raw_line) in enumerate(iter_lines(buf), 1):
+                    window.append((i, raw_line.decode('utf-8', 'ignore')))
+                    if len(window) > _WHEN_LOOKAHEAD + 1:
+                        line_num, line = window.popleft()
+                        self._check_ansible_performance_line(issues, line, line_num, window)
+                
+                # Lines near the end of the file don't have a full lookahead window
+                while window:
+                    line_num, line = window.popleft()
+                    self._check_ansible_performance_line(issues, line, line_num, None)
         
         except Exception as e:
             self.logger.warning(f"YAML performance analysis failed for {file_path}: {e}")
         
         return issues
     
-    def _is_ansible_file(self, file_path: str, content: str) -> bool:
+    def _check_ansible_performance_line(self, issues: List[Dict[str, Any]], line: str, line_num: int,
+                                        following: Optional[deque]) -> None:
+        """Check a single line of an Ansible file for performance issues."""
+        # Using shell/command when modules exist
+        if 'shell:' in line or 'command:' in line:
+            line_lower = line.lower()
+            if any(cmd in line_lower for cmd in ['apt ', 'yum ', 'pip ', 'git clone', 'systemctl']):
+                issues.append({
+                    'category': 'performance',
+                    'type': 'ansible_inefficient_module',
+                    'severity': 'medium',
+                    'description': 'Consider using specific Ansible modules instead of shell/command',
+                    'line': line_num,
+                    'code': line.strip(),
+                    'tool': 'ansible_analysis'
+                })
+        
+        # Missing when conditions for optimization
+        if 'register:' in line and following is not None:
+            next_lines = islice(following, _WHEN_LOOKAHEAD)
+            if not any('when:' in next_line for _, next_line in next_lines):
+                issues.append({
+                    'category': 'performance',
+                    'type': 'ansible_missing_when',
+                    'severity': 'low',
+                    'description': 'Consider adding when conditions to skip unnecessary tasks',
+                    'line': line_num,
+                    'code': line.strip(),
+                    'tool': 'ansible_analysis'
+                })
+        
+        # Inefficient loops
+        if 'with_items:' in line:
+            issues.append({
+                'category': 'performance',
+                'type': 'ansible_deprecated_loop',
+                'severity': 'medium',
+                'description': 'with_items is deprecated, use loop instead',
+                'line': line_num,
+                'code': line.strip(),
+                'tool': 'ansible_analysis'
+            })
+    
+    def _is_ansible_file(self, file_path: str, content: Union[str, bytes, mmap.mmap]) -> bool:
         """Determine if a YAML file is an Ansible playbook/role."""
         filename = os.path.basename(file_path).lower()
         
         # Check filename patterns
-        ansible_filenames = [
-            'playbook.yml', 'playbook.yaml', 'site.yml', 'site.yaml',
-            'main.yml', 'main.yaml'
-        ]
-        
-        if filename in ansible_filenames:
+        if filename in _ANSIBLE_FILENAMES:
             return True
         
         # Check for Ansible-specific keywords in content
-        ansible_keywords = [
-            'hosts:', 'tasks:', 'handlers:', 'vars:', 'roles:', 
-            'playbook:', 'become:', 'gather_facts:', 'ansible_',
-            'with_items:', 'when:', 'notify:', 'register:'
-        ]
-        
-        keyword_count = sum(1 for keyword in ansible_keywords if keyword in content)
+        keywords = _ANSIBLE_KEYWORDS if isinstance(content, str) else _ANSIBLE_KEYWORDS_BYTES
+        keyword_count = sum(1 for keyword in keywords if content.find(keyword) != -1)
         return keyword_count >= 3
     
+    def _is_ansible_file_path(self, file_path: str) -> bool:
+        """Determine if the YAML file at file_path is Ansible, reading it via a mapping."""
+        with map_file(file_path) as buf:
+            return self._is_ansible_file(file_path, buf)
+    
     def _analyze_ansible_quality_line(self, line: str, line_num: int) -> List[Dict[str, Any]]:
         """Analyze a single line for Ansible-specific quality issues."""
         issues = []
         
         # Check for deprecated syntax
-        deprecated_patterns = [
-            (r'include:', 'Use include_tasks or import_tasks instead of include'),
-            (r'sudo:', 'Use become instead of sudo'),
-            (r'sudo_user:', 'Use become_user instead of sudo_user'),
-            (r'always_run:', 'Use check_mode instead of always_run')
-        ]
-        
-        for pattern, message in deprecated_patterns:
-            if re.search(pattern, line):
+        for keyword, message in _ANSIBLE_DEPRECATED_SYNTAX:
+            if keyword in line:
                 issues.append({
                     'category': 'quality',
                     'type': 'ansible_deprecated_syntax',
@@ -1052,7 +1648,7 @@ class CodeAnalyzer:
         # Check for missing quotes around strings with variables
         if '{{' in line and '}}' in line:
             # Variable interpolation should be quoted
-            if re.search(r':\s*{{.*}}', line) and not re.search(r':\s*["\']{{.*}}["\']', line):
+            if _UNQUOTED_VARIABLE_RE.search(line) and not _QUOTED_VARIABLE_RE.search(line):
                 issues.append({
                     'category': 'quality',
                     'type': 'ansible_unquoted_variables',
@@ -1064,7 +1660,7 @@ class CodeAnalyzer:
                 })
         
         # Check for hardcoded values that should be variables
-        if re.search(r'(password|secret|key|token):\s*["\']?[a-zA-Z0-9]+["\']?', line, re.IGNORECASE):
+        if _ANSIBLE_SECRET_RE.search(line):
             issues.append({
                 'category': 'security',
                 'type': 'ansible_hardcoded_secret',
@@ -1077,12 +1673,13 @@ class CodeAnalyzer:
         
         return issues
     
-    def _analyze_ansible_structure(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _analyze_ansible_structure(self, content: Union[bytes, mmap.mmap], file_path: str) -> List[Dict[str, Any]]:
         """Analyze overall Ansible file structure."""
         issues = []
         
         # Check for missing essential sections
-        if 'hosts:' in content and 'tasks:' not in content and 'roles:' not in content:
+        if (content.find(b'hosts:') != -1 and content.find(b'tasks:') == -1
+                and content.find(b'roles:') == -1):
             issues.append({
                 'category': 'quality',
                 'type': 'ansible_missing_tasks',
@@ -1094,7 +1691,7 @@ class CodeAnalyzer:
             })
         
         # Check for overly complex playbooks
-        task_count = content.count('- name:')
+        task_count = count_occurrences(content, b'- name:')
         if task_count > 50:
             issues.append({
                 'category': 'quality',
@@ -1107,7 +1704,7 @@ class CodeAnalyzer:
             })
         
         # Check for missing documentation
-        if '- name:' in content and 'description:' not in content and '# ' not in content:
+        if task_count and content.find(b'description:') == -1 and content.find(b'# ') == -1:
             issues.append({
                 'category': 'quality',
                 'type': 'ansible_missing_documentation',
@@ -1120,21 +1717,17 @@ class CodeAnalyzer:
         
         return issues
     
+    @staticmethod
+    def _issues_in_category(issues: List[Dict[str, Any]], category: str) -> List[Dict[str, Any]]:
+        """Issues of the given category."""
+        return [issue for issue in issues if issue.get('category') == category]
+    
     def _calculate_security_score(self, issues: List[Dict[str, Any]], metrics: Dict[str, Any]) -> float:
         """Calculate security score (0-100)."""
         if not issues:
             return 100.0
         
-        penalty = 0
-        for issue in issues:
-            if issue.get('category') == 'security':
-                severity = issue.get('severity', 'medium')
-                if severity == 'high':
-                    penalty += 20
-                elif severity == 'medium':
-                    penalty += 10
-                else:  # low
-                    penalty += 5
+        penalty = _severity_penalty(issues, _SECURITY_PENALTIES)
         
         score = max(0, 100 - penalty)
         return score
@@ -1144,17 +1737,7 @@ class CodeAnalyzer:
         base_score = 100.0
         
         # Penalties for quality issues
-        quality_issues = [i for i in issues if i.get('category') == 'quality']
-        penalty = 0
-        
-        for issue in quality_issues:
-            severity = issue.get('severity', 'medium')
-            if severity == 'high':
-                penalty += 15
-            elif severity == 'medium':
-                penalty += 8
-            else:  # low
-                penalty += 3
+        penalty = _severity_penalty(issues, _QUALITY_PENALTIES)
         
         # Additional penalties based on metrics
         complexity = metrics.get('cyclomatic_complexity', 0)
@@ -1173,17 +1756,7 @@ class CodeAnalyzer:
         base_score = 100.0
         
         # Penalties for performance issues
-        performance_issues = [i for i in issues if i.get('category') == 'performance']
-        penalty = 0
-        
-        for issue in performance_issues:
-            severity = issue.get('severity', 'medium')
-            if severity == 'high':
-                penalty += 20
-            elif severity == 'medium':
-                penalty += 12
-            else:  # low
-                penalty += 5
+        penalty = _severity_penalty(issues, _PERFORMANCE_PENALTIES)
         
         score = max(0, base_score - penalty)
         return score
@@ -1191,117 +1764,84 @@ class CodeAnalyzer:
     def _generate_suggestions(self, issues: List[Dict[str, Any]], 
                            metrics: Dict[str, Any], language: str) -> List[Dict[str, Any]]:
         """Generate improvement suggestions based on analysis."""
-        suggestions = []
-        
-        # Group issues by type
-        issue_types = {}
-        for issue in issues:
-            issue_type = issue.get('type', 'unknown')
-            issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-        
-        # Generate suggestions based on common issues
-        if 'hardcoded_password' in issue_types or 'hardcoded_api_key' in issue_types:
-            suggestions.append({
-                'type': 'security',
-                'priority': 'high',
-                'description': 'Use environment variables or secure configuration files for secrets',
-                'category': 'best_practices'
-            })
-        
-        if metrics.get('cyclomatic_complexity', 0) > 15:
-            suggestions.append({
-                'type': 'refactoring',
-                'priority': 'medium',
-                'description': 'Consider breaking down complex functions into smaller, more manageable pieces',
-                'category': 'maintainability'
-            })
-        
-        if language == 'python':
-            if 'console_statement' in issue_types:
-                suggestions.append({
-                    'type': 'quality',
-                    'priority': 'low',
-                    'description': 'Replace print statements with proper logging',
-                    'category': 'best_practices'
-                })
+        issue_types = {issue.get('type', 'unknown') for issue in issues}
         
-        elif language in ['javascript', 'typescript']:
-            if 'var_usage' in issue_types:
-                suggestions.append({
-                    'type': 'modernization',
-                    'priority': 'medium',
-                    'description': 'Replace var with let/const for better scoping and immutability',
-                    'category': 'modern_syntax'
-                })
-        
-        return suggestions
+        return [
+            dict(suggestion) for applies, suggestion in _SUGGESTION_RULES
+            if applies(issue_types, metrics, language)
+        ]
     
     def _calculate_overall_scores(self, file_results: List[AnalysisResult]) -> Dict[str, float]:
         """Calculate overall repository scores."""
         if not file_results:
             return {'security': 0.0, 'quality': 0.0, 'performance': 0.0}
         
-        security_scores = [r.security_score for r in file_results]
-        quality_scores = [r.quality_score for r in file_results]
-        performance_scores = [r.performance_score for r in file_results]
+        security = quality = performance = 0
+        for result in file_results:
+            security += result.security_score
+            quality += result.quality_score
+            performance += result.performance_score
+        
+        count = len(file_results)
         
         return {
-            'security': sum(security_scores) / len(security_scores),
-            'quality': sum(quality_scores) / len(quality_scores),
-            'performance': sum(performance_scores) / len(performance_scores)
+            'security': security / count,
+            'quality': quality / count,
+            'performance': performance / count
         }
     
     def _analyze_dependencies(self, repo_path: str) -> Dict[str, List[str]]:
         """Analyze repository dependencies."""
-        dependencies = {'direct': [], 'dev': [], 'optional': []}
-        
-        # Common dependency files
-        dep_files = [
-            'requirements.txt', 'requirements-dev.txt', 'Pipfile',
-            'pyproject.toml', 'package.json', 'go.mod', 'Cargo.toml',
-            'pom.xml', 'build.gradle', 'composer.json'
-        ]
-        
-        for dep_file in dep_files:
-            file_path = os.path.join(repo_path, dep_file)
-            if os.path.exists(file_path):
-                file_deps = detect_dependencies(file_path)
-                for key in dependencies:
-                    dependencies[key].extend(file_deps.get(key, []))
-        
-        # Remove duplicates
-        for key in dependencies:
-            dependencies[key] = list(set(dependencies[key]))
+        # One directory listing instead of a stat per candidate file
+        try:
+            with os.scandir(repo_path) as entries:
+                present = sorted(
+                    (entry.name, entry.stat()) for entry in entries
+                    if entry.name in _DEPENDENCY_FILES and entry.is_file()
+                )
+        except OSError:
+            present = []
+        
+        # Re-analyzing an unchanged checkout reuses the parsed result
+        signature = (repo_path, tuple((name, stat.st_mtime_ns, stat.st_size) for name, stat in present))
+        cached = self._dependency_cache.get(signature)
+        if cached is None:
+            # Dicts deduplicate on insert while keeping first-seen order
+            found = {'direct': {}, 'dev': {}, 'optional': {}}
+            for name, _ in present:
+                file_deps = detect_dependencies(os.path.join(repo_path, name))
+                for key in found:
+                    found[key].update(dict.fromkeys(file_deps.get(key, [])))
+            
+            cached = {key: tuple(packages) for key, packages in found.items()}
+            self._dependency_cache[signature] = cached
         
-        return dependencies
+        return {key: list(packages) for key, packages in cached.items()}
     
     def _generate_summary(self, file_results: List[AnalysisResult], 
                          languages: Dict[str, int], 
                          dependencies: Dict[str, List[str]]) -> Dict[str, Any]:
         """Generate analysis summary."""
-        total_issues = sum(len(r.issues) for r in file_results)
-        
-        # Count issues by category
-        security_issues = sum(1 for r in file_results for i in r.issues if i.get('category') == 'security')
-        quality_issues = sum(1 for r in file_results for i in r.issues if i.get('category') == 'quality')
-        performance_issues = sum(1 for r in file_results for i in r.issues if i.get('category') == 'performance')
+        # Flatten once and let Counter tally each field in C
+        issues = list(chain.from_iterable(result.issues for result in file_results))
+        total_issues = len(issues)
+        categories = Counter(map(_ISSUE_CATEGORY, issues))
+        severities = Counter(map(_ISSUE_SEVERITY, issues))
         
-        # Count issues by severity
-        high_severity = sum(1 for r in file_results for i in r.issues if i.get('severity') == 'high')
-        medium_severity = sum(1 for r in file_results for i in r.issues if i.get('severity') == 'medium')
-        low_severity = sum(1 for r in file_results for i in r.issues if i.get('severity') == 'low')
+        security_issues = categories['security']
+        high_severity = severities['high']
         
         return {
             'total_issues': total_issues,
             'issues_by_category': {
                 'security': security_issues,
-                'quality': quality_issues,
-                'performance': performance_issues
+                'quality': categories['quality'],
+                'performance': categories['performance']
             },
             'issues_by_severity': {
                 'high': high_severity,
-                'medium': medium_severity,
-                'low': low_severity
+                'medium': severities['medium'],
+                'low': severities['low']
             },
             'languages_detected': list(languages.keys()),
             'most_common_language': max(languages.items(), key=lambda x: x[1])[0] if languages else 'unknown',
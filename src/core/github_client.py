@@ -6,44 +6,129 @@ Provides comprehensive GitHub API operations for code review and analysis.
 """
 
 import asyncio
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import random
+import time
+from itertools import islice
+from typing import Dict, List, Optional, Any, AsyncIterator, Awaitable, Callable, Hashable
 from datetime import datetime
 import aiohttp
-from github import Github, Auth, GithubException
-from github.Repository import Repository
-from github.PullRequest import PullRequest
-from github.GithubException import GithubException
+from yarl import URL
+
+from ..utils.cache import TTLCache
+from ..utils.helpers import json_dumps, json_loads
+
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Rate-limited requests are retried up to this many times in total, waiting at
+# most MAX_RATE_LIMIT_WAIT seconds (plus jitter) between attempts
+MAX_REQUEST_ATTEMPTS = 5
+MAX_RATE_LIMIT_WAIT = 60
+
+# Requests are only paced once fewer than this many remain in the rate limit window
+RATE_LIMIT_LOW_WATERMARK = 100
+
+# File contents change more often than repository metadata, so expire them sooner
+FILE_CACHE_TTL = 900
+
+# Bodies kept for conditional requests are revalidated with the server on every
+# use, so they can be kept much longer than the metadata cache
+ETAG_CACHE_TTL = 24 * 3600
+
+# Response bodies larger than this are decoded in a worker thread so big tree
+# listings and GraphQL batches don't stall other requests
+JSON_THREAD_THRESHOLD = 256 * 1024
+
+# Aliased blob lookups per GraphQL query when fetching many files at once
+GRAPHQL_FILES_PER_QUERY = 50
+
+
+class GitHubAPIError(Exception):
+    """Error response returned by the GitHub REST API."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+def _isoformat(timestamp: Optional[str]) -> Optional[str]:
+    """Normalise a GitHub timestamp ('2024-01-01T00:00:00Z') to datetime.isoformat()."""
+    if not timestamp:
+        return None
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).isoformat()
 
 
 class GitHubClient:
     """Enhanced GitHub API client with dynamic repository support."""
     
-    def __init__(self, config):
-        """Initialize GitHub client with configuration."""
+    def __init__(self, config, connector: Optional[aiohttp.BaseConnector] = None):
+        """Initialize GitHub client with configuration.
+        
+        Pass a connector to share one connection pool between several clients;
+        the client then leaves closing it to the caller.
+        """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.github: Optional[Github] = None
         self.session: Optional[aiohttp.ClientSession] = None
+        self._shared_connector = connector
         self.rate_limit_remaining = 5000
+        self.rate_limit_limit = 5000
+        self.rate_limit_reset = 0
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
         
+        # Repository metadata and file contents are requested repeatedly for the same
+        # repository during an analysis; reuse responses for a while
+        self._meta_cache = TTLCache(
+            maxsize=1024 if config.ENABLE_CACHING else 0,
+            ttl=config.CACHE_DURATION
+        )
+        self._file_cache = TTLCache(
+            maxsize=2048 if config.ENABLE_CACHING else 0,
+            ttl=min(config.CACHE_DURATION, FILE_CACHE_TTL)
+        )
+        
+        # Last ETag, body and links per GET URL, for conditional requests
+        self._etag_cache = TTLCache(
+            maxsize=4096 if config.ENABLE_CACHING else 0,
+            ttl=ETAG_CACHE_TTL
+        )
+        
+        # The ETag cache is saved on close and reloaded on initialize, so a restarted
+        # server revalidates what it fetched last time instead of downloading it again
+        self._etag_file = os.path.join(config.CACHE_DIR, 'etags.json') if config.ENABLE_CACHING else None
+        
+        # Fetches currently running, so concurrent callers asking for the same
+        # resource share one request
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+    
     async def initialize(self):
         """Initialize GitHub authentication and client."""
         try:
             self.logger.info("🔐 Initializing GitHub authentication...")
             
+            # Bounds the number of API requests in flight at once; created here so
+            # it belongs to the running event loop
+            self._request_semaphore = asyncio.Semaphore(max(1, self.config.ASYNC_CONCURRENCY))
+            
+            if self._etag_file:
+                await asyncio.to_thread(self._load_etag_cache)
+            
             # Try GitHub App authentication first
-            if (self.config.GITHUB_APP_ID and 
-                self.config.GITHUB_APP_PRIVATE_KEY_PATH and 
+            if (self.config.GITHUB_APP_ID and
+                self.config.GITHUB_APP_PRIVATE_KEY_PATH and
                 self.config.GITHUB_APP_INSTALLATION_ID):
                 
                 self.logger.info("Using GitHub App authentication")
                 await self._init_github_app()
-                
+            
             elif self.config.GITHUB_TOKEN:
                 self.logger.info("Using Personal Access Token authentication")
                 await self._init_personal_token()
-                
+            
             else:
                 raise ValueError(
                     "No GitHub authentication configured. "
@@ -53,20 +138,13 @@ class GitHubClient:
             # Test authentication
             await self._test_authentication()
             
-            # Initialize HTTP session for additional API calls
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={
-                    "Authorization": f"token {self._get_token()}",
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "DynamicGitHubCodeReview/1.0"
-                }
-            )
-            
             self.logger.info("✅ GitHub client initialized successfully")
-            
+        
         except Exception as e:
             self.logger.error(f"❌ GitHub client initialization failed: {e}")
+            if self.session:
+                await self.session.close()
+                self.session = None
             raise
     
     async def _init_github_app(self):
@@ -77,111 +155,286 @@ class GitHubClient:
     
     async def _init_personal_token(self):
         """Initialize Personal Access Token authentication."""
-        auth = Auth.Token(self.config.GITHUB_TOKEN)
-        self.github = Github(auth=auth)
+        # All API calls go through this session, so requests never block the event loop.
+        # Its connector keeps connections to the API alive and reuses them across
+        # requests instead of paying a TCP+TLS handshake for each concurrent call
+        connector = self._shared_connector or aiohttp.TCPConnector(
+            limit=max(1, self.config.ASYNC_CONCURRENCY),
+            keepalive_timeout=60,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(
+            base_url=GITHUB_API_URL,
+            connector=connector,
+            connector_owner=self._shared_connector is None,
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={
+                "Authorization": f"token {self._get_token()}",
+                # mercy-preview makes listings include topics on servers where they are
+                # still a preview, so they never need a per-repository /topics request
+                "Accept": "application/vnd.github.mercy-preview+json, application/vnd.github.v3+json",
+                "User-Agent": "DynamicGitHubCodeReview/1.0"
+            }
+        )
     
     async def _test_authentication(self):
         """Test GitHub authentication and get user info."""
         try:
-            user = self.github.get_user()
-            self.logger.info(f"🔗 Authenticated as: {user.login}")
-            
-            # Set a default rate limit for now
-            self.rate_limit_remaining = 5000
-            self.logger.info(f"📊 API rate limit: assumed 5000/5000")
+            user = await self._get_json("/user")
+            self.logger.info(f"🔗 Authenticated as: {user['login']}")
             
-        except GithubException as e:
+            # Rate limit state is read from every response's headers
+            self.logger.info(f"📊 API rate limit: {self.rate_limit_remaining}/{self.rate_limit_limit}")
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
             raise Exception(f"GitHub authentication test failed: {e}")
     
     def _get_token(self) -> str:
         """Get the current authentication token."""
         return self.config.GITHUB_TOKEN
     
-    async def get_user_repositories(self, username: str) -> List[Dict[str, Any]]:
-        """Get all repositories for a specific user."""
-        try:
-            self.logger.info(f"📦 Fetching repositories for user: {username}")
-            
-            user = self.github.get_user(username)
-            repositories = []
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request to the GitHub API and return the decoded JSON body."""
+        data, _ = await self._request_with_links(method, path, **kwargs)
+        return data
+    
+    async def _request_with_links(self, method: str, path: str, raw: bool = False, **kwargs) -> tuple:
+        """Send a request to an API path, returning the body (JSON, or bytes if raw) and the response's Link relations."""
+        if not self.session:
+            raise RuntimeError("GitHub client is not initialized")
+        
+        # JSON GETs are made conditional on the ETag of the last response for the same
+        # URL; an unchanged resource comes back as a bodiless 304 that costs no quota
+        etag_key = None
+        cached = None
+        if method == "GET" and not raw:
+            params = kwargs.get('params')
+            etag_key = (path, tuple(sorted(params.items())) if params else ())
+            cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                kwargs['headers'] = {**kwargs.get('headers', {}), "If-None-Match": cached[0]}
+        
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            await self._throttle()
             
-            # Get repositories with pagination
-            for repo in user.get_repos(type='all', sort='updated'):
-                # Apply filters
-                if not self.config.INCLUDE_FORKS and repo.fork:
-                    continue
-                    
-                if not self.config.INCLUDE_PRIVATE_REPOS and repo.private:
-                    continue
+            async with self._request_semaphore, self.session.request(method, path, **kwargs) as response:
+                self._update_rate_limit(response.headers)
                 
-                repo_data = {
-                    'id': repo.id,
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'description': repo.description,
-                    'language': repo.language,
-                    'default_branch': repo.default_branch,
-                    'private': repo.private,
-                    'fork': repo.fork,
-                    'archived': repo.archived,
-                    'disabled': repo.disabled,
-                    'size': repo.size,
-                    'stargazers_count': repo.stargazers_count,
-                    'watchers_count': repo.watchers_count,
-                    'forks_count': repo.forks_count,
-                    'open_issues_count': repo.open_issues_count,
-                    'topics': repo.get_topics(),
-                    'created_at': repo.created_at.isoformat() if repo.created_at else None,
-                    'updated_at': repo.updated_at.isoformat() if repo.updated_at else None,
-                    'pushed_at': repo.pushed_at.isoformat() if repo.pushed_at else None,
-                    'clone_url': repo.clone_url,
-                    'html_url': repo.html_url,
-                    'api_url': repo.url
-                }
+                if response.status == 304 and cached is not None:
+                    return cached[1], cached[2]
+                
+                if response.status < 400:
+                    if raw:
+                        return await response.read(), response.links
+                    data = await self._decode_json(await response.read()) if response.status != 204 else None
+                    if etag_key is not None and 'ETag' in response.headers:
+                        self._etag_cache.set(etag_key, (response.headers['ETag'], data, response.links))
+                    return data, response.links
                 
-                repositories.append(repo_data)
+                try:
+                    message = json_loads(await response.read()).get('message', response.reason)
+                except (ValueError, AttributeError):
+                    message = response.reason
                 
-                # Respect rate limits
-                if len(repositories) >= self.config.MAX_REPOSITORIES:
-                    break
-                    
-                # Add small delay to avoid rate limiting
-                await asyncio.sleep(self.config.REQUEST_DELAY)
+                delay = self._rate_limit_delay(response, message, attempt)
+                if delay is None or attempt == MAX_REQUEST_ATTEMPTS - 1:
+                    raise GitHubAPIError(response.status, message)
+            
+            # Back off outside the semaphore so other requests aren't held up
+            self.logger.warning(f"⏳ GitHub rate limit hit for {path}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    async def _decode_json(body: bytes) -> Any:
+        """Decode a JSON response body, off the event loop when it is large."""
+        if len(body) > JSON_THREAD_THRESHOLD:
+            return await asyncio.to_thread(json_loads, body)
+        return json_loads(body)
+    
+    async def _throttle(self):
+        """Spread the remaining quota over the time left until reset once it runs low."""
+        if self.rate_limit_remaining >= RATE_LIMIT_LOW_WATERMARK:
+            return
+        
+        window = self.rate_limit_reset - time.time()
+        if window > 0:
+            delay = window / max(self.rate_limit_remaining, 1)
+            await asyncio.sleep(min(delay, MAX_RATE_LIMIT_WAIT))
+    
+    def _update_rate_limit(self, headers):
+        """Record the rate limit state reported by a response."""
+        if 'X-RateLimit-Remaining' in headers:
+            self.rate_limit_remaining = int(headers['X-RateLimit-Remaining'])
+        if 'X-RateLimit-Limit' in headers:
+            self.rate_limit_limit = int(headers['X-RateLimit-Limit'])
+        if 'X-RateLimit-Reset' in headers:
+            self.rate_limit_reset = int(headers['X-RateLimit-Reset'])
+    
+    @staticmethod
+    def _rate_limit_delay(response: aiohttp.ClientResponse, message: str, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, or None if it isn't one."""
+        headers = response.headers
+        if 'Retry-After' in headers:
+            delay = float(headers['Retry-After'])
+        elif headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+            # Primary rate limit: wait for the window to reset
+            delay = int(headers['X-RateLimit-Reset']) - time.time()
+        elif response.status == 429 or 'rate limit' in str(message).lower():
+            # Secondary rate limit without a hint: exponential backoff
+            delay = 2 ** attempt
+        else:
+            # Other 4xx/5xx responses (permissions, missing resources) are not retried
+            return None
+        
+        return min(max(delay, 0), MAX_RATE_LIMIT_WAIT) + random.random()
+    
+    async def _get_json(self, path: str, **params) -> Any:
+        """GET a GitHub API resource and return the decoded JSON body."""
+        return await self._request("GET", path, params=params or None)
+    
+    async def _iter_pages(self, path: str, **params) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each page of a paginated GitHub API listing, following Link headers."""
+        params.setdefault('per_page', 100)
+        url: Optional[str] = path
+        
+        while url:
+            page, links = await self._request_with_links("GET", url, params=params)
+            yield page
+            
+            # The next link already carries the query string; keep it relative to the base URL
+            next_link = links.get('next')
+            url = str(next_link['url'].relative()) if next_link else None
+            params = None
+    
+    async def get_user_repositories(self, username: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the repositories of a specific user as their listing pages arrive."""
+        try:
+            self.logger.info(f"📦 Fetching repositories for user: {username}")
+            
+            path = f"/users/{username}/repos"
+            params = {'type': 'all', 'sort': 'updated', 'per_page': 100}
+            count = 0
+            
+            # The first page's Link header tells how many pages there are
+            first_page, links = await self._request_with_links("GET", path, params=params)
+            last_page = self._last_page_number(links)
+            
+            # Respect the configured limit
+            for repo_data in islice(self._filter_repositories(first_page), self.config.MAX_REPOSITORIES):
+                yield repo_data
+                count += 1
             
-            self.logger.info(f"✅ Found {len(repositories)} repositories")
-            return repositories
+            # Fetch the remaining pages concurrently, a window at a time so that
+            # no more pages are requested than MAX_REPOSITORIES needs. Pages are
+            # yielded in listing order, each as soon as it and those before it arrive
+            window_size = max(1, self.config.ASYNC_CONCURRENCY)
+            next_page = 2
+            while count < self.config.MAX_REPOSITORIES and next_page <= last_page:
+                window = range(next_page, min(last_page + 1, next_page + window_size))
+                tasks = [
+                    asyncio.ensure_future(self._fetch_repo_page(path, page, params))
+                    for page in window
+                ]
+                try:
+                    for task in tasks:
+                        for repo_data in islice(await task, self.config.MAX_REPOSITORIES - count):
+                            yield repo_data
+                            count += 1
+                        if count >= self.config.MAX_REPOSITORIES:
+                            break
+                finally:
+                    # Don't leave requests running when stopped early or abandoned, and
+                    # collect failures of pages no longer needed so none goes unretrieved
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                next_page = window.stop
             
-        except GithubException as e:
+            self.logger.info(f"✅ Found {count} repositories")
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
             self.logger.error(f"❌ Failed to fetch repositories: {e}")
             raise
     
+    async def _fetch_repo_page(self, path: str, page: int, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch one page of a repository listing and convert it to repository dicts."""
+        return self._filter_repositories(await self._get_json(path, page=page, **params))
+    
+    def _filter_repositories(self, repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply the fork/private filters to raw repository JSON and convert the rest."""
+        return [
+            self._repository_summary(repo) for repo in repos
+            if (self.config.INCLUDE_FORKS or not repo['fork']) and
+               (self.config.INCLUDE_PRIVATE_REPOS or not repo['private'])
+        ]
+    
+    @staticmethod
+    def _repository_summary(repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a repository listing entry to the client's repository dict."""
+        return {
+            'id': repo['id'],
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'description': repo['description'],
+            'language': repo['language'],
+            'default_branch': repo['default_branch'],
+            'private': repo['private'],
+            'fork': repo['fork'],
+            'archived': repo['archived'],
+            'disabled': repo['disabled'],
+            'size': repo['size'],
+            'stargazers_count': repo['stargazers_count'],
+            'watchers_count': repo['watchers_count'],
+            'forks_count': repo['forks_count'],
+            'open_issues_count': repo['open_issues_count'],
+            'topics': repo.get('topics', []),
+            'created_at': _isoformat(repo['created_at']),
+            'updated_at': _isoformat(repo['updated_at']),
+            'pushed_at': _isoformat(repo['pushed_at']),
+            'clone_url': repo['clone_url'],
+            'html_url': repo['html_url'],
+            'api_url': repo['url']
+        }
+    
+    @staticmethod
+    def _last_page_number(links) -> int:
+        """Read the page count from a response's Link relations (1 when there is no last link)."""
+        last_link = links.get('last')
+        if not last_link:
+            return 1
+        return int(last_link['url'].query.get('page', 1))
+    
     async def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
         """Get detailed information about a specific repository."""
         try:
-            repository = self.github.get_repo(f"{owner}/{repo}")
+            # The repository and its language breakdown are independent requests
+            repository, languages = await asyncio.gather(
+                self._get_repository_json(f"{owner}/{repo}"),
+                self._get_repository_languages(owner, repo)
+            )
             
             return {
-                'id': repository.id,
-                'name': repository.name,
-                'full_name': repository.full_name,
-                'description': repository.description,
-                'language': repository.language,
-                'languages': await self._get_repository_languages(owner, repo),
-                'default_branch': repository.default_branch,
-                'private': repository.private,
-                'size': repository.size,
-                'stargazers_count': repository.stargazers_count,
-                'forks_count': repository.forks_count,
-                'open_issues_count': repository.open_issues_count,
-                'topics': repository.get_topics(),
-                'license': repository.license.name if repository.license else None,
-                'created_at': repository.created_at.isoformat(),
-                'updated_at': repository.updated_at.isoformat(),
-                'clone_url': repository.clone_url,
-                'html_url': repository.html_url
+                'id': repository['id'],
+                'name': repository['name'],
+                'full_name': repository['full_name'],
+                'description': repository['description'],
+                'language': repository['language'],
+                'languages': languages,
+                'default_branch': repository['default_branch'],
+                'private': repository['private'],
+                'size': repository['size'],
+                'stargazers_count': repository['stargazers_count'],
+                'forks_count': repository['forks_count'],
+                'open_issues_count': repository['open_issues_count'],
+                'topics': list(repository.get('topics', [])),
+                'license': repository['license']['name'] if repository.get('license') else None,
+                'created_at': _isoformat(repository['created_at']),
+                'updated_at': _isoformat(repository['updated_at']),
+                'clone_url': repository['clone_url'],
+                'html_url': repository['html_url']
             }
-            
-        except GithubException as e:
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
             self.logger.error(f"❌ Failed to get repository {owner}/{repo}: {e}")
             raise
     
@@ -189,172 +442,326 @@ class GitHubClient:
         """Get programming languages used in the repository."""
         if not self.session:
             return {}
-            
-        try:
-            async with self.session.get(
-                f"https://api.github.com/repos/{owner}/{repo}/languages"
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
+        
+        key = ('languages', owner, repo)
+        languages = self._meta_cache.get(key)
+        if languages is None:
+            try:
+                languages = await self._coalesce(
+                    key, lambda: self._get_json(f"/repos/{owner}/{repo}/languages")
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to get languages for {owner}/{repo}: {e}")
                 return {}
-        except Exception as e:
-            self.logger.warning(f"Failed to get languages for {owner}/{repo}: {e}")
-            return {}
+            self._meta_cache.set(key, languages)
+        
+        return dict(languages)
+    
+    async def _get_repository_json(self, full_name: str) -> Dict[str, Any]:
+        """Get a repository's API representation, reusing a recent response if there is one."""
+        key = ('repo', full_name)
+        repository = self._meta_cache.get(key)
+        if repository is None:
+            repository = await self._coalesce(key, lambda: self._get_json(f"/repos/{full_name}"))
+            self._meta_cache.set(key, repository)
+        return repository
+    
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fetch(), sharing one running call between concurrent callers with the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None))
+        
+        # Shielded so one caller being cancelled does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    def cache_clear(self):
+        """Drop all cached repository metadata, file contents and ETags."""
+        self._meta_cache.clear()
+        self._file_cache.clear()
+        self._etag_cache.clear()
     
     async def get_pull_requests(self, owner: str, repo: str, state: str = "open") -> List[Dict[str, Any]]:
         """Get pull requests for a repository."""
         try:
-            repository = self.github.get_repo(f"{owner}/{repo}")
             pull_requests = []
             
-            for pr in repository.get_pulls(state=state):
-                pr_data = {
-                    'number': pr.number,
-                    'title': pr.title,
-                    'body': pr.body,
-                    'state': pr.state,
-                    'user': {
-                        'login': pr.user.login,
-                        'avatar_url': pr.user.avatar_url
-                    },
-                    'head': {
-                        'ref': pr.head.ref,
-                        'sha': pr.head.sha
-                    },
-                    'base': {
-                        'ref': pr.base.ref,
-                        'sha': pr.base.sha
-                    },
-                    'created_at': pr.created_at.isoformat(),
-                    'updated_at': pr.updated_at.isoformat(),
-                    'mergeable': pr.mergeable,
-                    'additions': pr.additions,
-                    'deletions': pr.deletions,
-                    'changed_files': pr.changed_files,
-                    'html_url': pr.html_url
-                }
-                pull_requests.append(pr_data)
+            async for page in self._iter_pages(f"/repos/{owner}/{repo}/pulls", state=state):
+                # Mergeability and diff stats are only returned by the single-PR endpoint;
+                # fetch the details for a whole page at once
+                details = await asyncio.gather(*(
+                    self._get_json(f"/repos/{owner}/{repo}/pulls/{listed_pr['number']}")
+                    for listed_pr in page
+                ))
+                pull_requests.extend(map(self._pull_request_summary, details))
             
             return pull_requests
-            
-        except GithubException as e:
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
             self.logger.error(f"❌ Failed to get pull requests for {owner}/{repo}: {e}")
             raise
     
+    @staticmethod
+    def _pull_request_summary(pr: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the pull request summary returned to callers from a single-PR API response."""
+        return {
+            'number': pr['number'],
+            'title': pr['title'],
+            'body': pr['body'],
+            'state': pr['state'],
+            'user': {
+                'login': pr['user']['login'],
+                'avatar_url': pr['user']['avatar_url']
+            },
+            'head': {
+                'ref': pr['head']['ref'],
+                'sha': pr['head']['sha']
+            },
+            'base': {
+                'ref': pr['base']['ref'],
+                'sha': pr['base']['sha']
+            },
+            'created_at': _isoformat(pr['created_at']),
+            'updated_at': _isoformat(pr['updated_at']),
+            'mergeable': pr['mergeable'],
+            'additions': pr['additions'],
+            'deletions': pr['deletions'],
+            'changed_files': pr['changed_files'],
+            'html_url': pr['html_url']
+        }
+    
     async def get_file_content(self, owner: str, repo: str, path: str, ref: str = None) -> str:
         """Get content of a specific file from the repository."""
+        key = (owner, repo, path, ref)
+        content = self._file_cache.get(key)
+        if content is not None:
+            return content
+        
         try:
-            repository = self.github.get_repo(f"{owner}/{repo}")
+            # The raw media type returns the file bytes themselves instead of base64 in JSON
+            body, _ = await self._coalesce(('file',) + key, lambda: self._request_with_links(
+                "GET",
+                f"/repos/{owner}/{repo}/contents/{path}",
+                raw=True,
+                params={'ref': ref} if ref else None,
+                headers={"Accept": "application/vnd.github.raw"}
+            ))
+            content = body.decode('utf-8', errors='replace')
             
-            if ref:
-                file_content = repository.get_contents(path, ref=ref)
+            self._file_cache.set(key, content)
+            return content
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
+            self.logger.error(f"❌ Failed to get file content {owner}/{repo}:{path}: {e}")
+            raise
+    
+    async def get_files_content(self, owner: str, repo: str, paths: List[str],
+                                ref: str = "HEAD") -> Dict[str, str]:
+        """Get the contents of many files in a few GraphQL queries; binary or missing files are left out."""
+        contents = {}
+        missing = []
+        for path in paths:
+            content = self._file_cache.get((owner, repo, path, ref))
+            if content is not None:
+                contents[path] = content
             else:
-                file_content = repository.get_contents(path)
+                missing.append(path)
+        
+        try:
+            chunks = [
+                missing[start:start + GRAPHQL_FILES_PER_QUERY]
+                for start in range(0, len(missing), GRAPHQL_FILES_PER_QUERY)
+            ]
+            for chunk_contents in await asyncio.gather(*(
+                self._query_files_content(owner, repo, chunk, ref) for chunk in chunks
+            )):
+                for path, content in chunk_contents.items():
+                    self._file_cache.set((owner, repo, path, ref), content)
+                    contents[path] = content
             
-            if file_content.encoding == 'base64':
-                import base64
-                return base64.b64decode(file_content.content).decode('utf-8')
-            else:
-                return file_content.decoded_content.decode('utf-8')
-                
-        except GithubException as e:
-            self.logger.error(f"❌ Failed to get file content {owner}/{repo}:{path}: {e}")
+            return contents
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
+            self.logger.error(f"❌ Failed to get file contents for {owner}/{repo}: {e}")
             raise
     
+    async def _query_files_content(self, owner: str, repo: str, paths: List[str], ref: str) -> Dict[str, str]:
+        """Fetch the text of up to GRAPHQL_FILES_PER_QUERY files with one aliased GraphQL query."""
+        # Expressions are quoted with json.dumps, which produces valid GraphQL string literals
+        fields = " ".join(
+            f"f{index}: object(expression: {json.dumps(f'{ref}:{path}')}) {{ ... on Blob {{ text }} }}"
+            for index, path in enumerate(paths)
+        )
+        query = (
+            "query($owner: String!, $name: String!) { "
+            f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+        
+        response = await self._request(
+            "POST", "/graphql",
+            json={'query': query, 'variables': {'owner': owner, 'name': repo}}
+        )
+        
+        repository = (response.get('data') or {}).get('repository')
+        if repository is None:
+            errors = response.get('errors') or [{}]
+            raise GitHubAPIError(200, errors[0].get('message', 'GraphQL query failed'))
+        
+        contents = {}
+        for index, path in enumerate(paths):
+            blob = repository.get(f"f{index}")
+            if blob and blob.get('text') is not None:
+                contents[path] = blob['text']
+        return contents
+    
     async def get_repository_tree(self, owner: str, repo: str, ref: str = None) -> List[Dict[str, Any]]:
         """Get the file tree of a repository."""
         try:
-            repository = self.github.get_repo(f"{owner}/{repo}")
-            
             if ref is None:
-                ref = repository.default_branch
-                
-            tree = repository.get_git_tree(ref, recursive=True)
+                repository = await self._get_repository_json(f"{owner}/{repo}")
+                ref = repository['default_branch']
             
-            files = []
-            for element in tree.tree:
-                if element.type == 'blob':  # Files only, not directories
-                    files.append({
-                        'path': element.path,
-                        'size': element.size,
-                        'sha': element.sha,
-                        'type': element.type,
-                        'url': element.url
-                    })
+            tree = await self._get_json(f"/repos/{owner}/{repo}/git/trees/{ref}", recursive=1)
             
-            return files
+            # Recursive listings are capped server-side; walk truncated trees per directory
+            elements = tree['tree']
+            if tree.get('truncated'):
+                self.logger.info(f"🌳 Tree for {owner}/{repo} was truncated, listing directories individually")
+                elements = await self._walk_tree(owner, repo, tree['sha'])
             
-        except GithubException as e:
+            # Files only, not directories
+            return [
+                {
+                    'path': element['path'],
+                    'size': element.get('size'),
+                    'sha': element['sha'],
+                    'type': element['type'],
+                    'url': element['url']
+                }
+                for element in elements if element['type'] == 'blob'
+            ]
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
             self.logger.error(f"❌ Failed to get repository tree {owner}/{repo}: {e}")
             raise
     
-    async def create_pull_request_review(self, owner: str, repo: str, pr_number: int, 
+    async def _walk_tree(self, owner: str, repo: str, tree_sha: str, prefix: str = "") -> List[Dict[str, Any]]:
+        """List a tree's entries with full paths, fetching its subdirectories concurrently."""
+        tree = await self._get_json(f"/repos/{owner}/{repo}/git/trees/{tree_sha}")
+        
+        elements = [{**element, 'path': prefix + element['path']} for element in tree['tree']]
+        subtrees = await asyncio.gather(*(
+            self._walk_tree(owner, repo, element['sha'], element['path'] + '/')
+            for element in elements if element['type'] == 'tree'
+        ))
+        
+        for subtree in subtrees:
+            elements.extend(subtree)
+        return elements
+    
+    async def create_pull_request_review(self, owner: str, repo: str, pr_number: int,
                                        body: str, event: str = "COMMENT") -> Dict[str, Any]:
         """Create a review on a pull request."""
         try:
-            repository = self.github.get_repo(f"{owner}/{repo}")
-            pr = repository.get_pull(pr_number)
-            
-            review = pr.create_review(body=body, event=event)
+            review = await self._request(
+                "POST",
+                f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews",
+                json={'body': body, 'event': event}
+            )
             
             return {
-                'id': review.id,
-                'user': review.user.login,
-                'body': review.body,
-                'state': review.state,
-                'html_url': review.html_url,
-                'submitted_at': review.submitted_at.isoformat() if review.submitted_at else None
+                'id': review['id'],
+                'user': review['user']['login'],
+                'body': review['body'],
+                'state': review['state'],
+                'html_url': review['html_url'],
+                'submitted_at': _isoformat(review.get('submitted_at'))
             }
-            
-        except GithubException as e:
+        
+        except (GitHubAPIError, aiohttp.ClientError) as e:
             self.logger.error(f"❌ Failed to create review for {owner}/{repo}#{pr_number}: {e}")
             raise
-
+    
     async def get_repository_info(self, repository: str) -> Dict[str, Any]:
         """Get detailed information about a repository."""
         try:
             self.logger.info(f"📋 Getting repository info for: {repository}")
             
-            repo = self.github.get_repo(repository)
+            repo = await self._get_repository_json(repository)
             
             return {
-                'id': repo.id,
-                'name': repo.name,
-                'full_name': repo.full_name,
-                'owner': repo.owner.login,
-                'private': repo.private,
-                'html_url': repo.html_url,
-                'clone_url': repo.clone_url,
-                'ssh_url': repo.ssh_url,
-                'description': repo.description,
-                'language': repo.language,
-                'size': repo.size,
-                'default_branch': repo.default_branch,
-                'open_issues_count': repo.open_issues_count,
-                'forks_count': repo.forks_count,
-                'stargazers_count': repo.stargazers_count,
-                'watchers_count': repo.watchers_count,
-                'created_at': repo.created_at.isoformat() if repo.created_at else None,
-                'updated_at': repo.updated_at.isoformat() if repo.updated_at else None,
-                'pushed_at': repo.pushed_at.isoformat() if repo.pushed_at else None,
-                'fork': repo.fork,
-                'archived': repo.archived,
-                'disabled': repo.disabled,
-                'topics': repo.get_topics() if hasattr(repo, 'get_topics') else [],
-                'license': repo.license.name if repo.license else None,
-                'has_issues': repo.has_issues,
-                'has_projects': repo.has_projects,
-                'has_wiki': repo.has_wiki,
-                'has_pages': repo.has_pages,
-                'has_downloads': repo.has_downloads
+                'id': repo['id'],
+                'name': repo['name'],
+                'full_name': repo['full_name'],
+                'owner': repo['owner']['login'],
+                'private': repo['private'],
+                'html_url': repo['html_url'],
+                'clone_url': repo['clone_url'],
+                'ssh_url': repo['ssh_url'],
+                'description': repo['description'],
+                'language': repo['language'],
+                'size': repo['size'],
+                'default_branch': repo['default_branch'],
+                'open_issues_count': repo['open_issues_count'],
+                'forks_count': repo['forks_count'],
+                'stargazers_count': repo['stargazers_count'],
+                'watchers_count': repo['watchers_count'],
+                'created_at': _isoformat(repo['created_at']),
+                'updated_at': _isoformat(repo['updated_at']),
+                'pushed_at': _isoformat(repo['pushed_at']),
+                'fork': repo['fork'],
+                'archived': repo['archived'],
+                'disabled': repo['disabled'],
+                'topics': list(repo.get('topics', [])),
+                'license': repo['license']['name'] if repo.get('license') else None,
+                'has_issues': repo['has_issues'],
+                'has_projects': repo['has_projects'],
+                'has_wiki': repo['has_wiki'],
+                'has_pages': repo['has_pages'],
+                'has_downloads': repo.get('has_downloads')
             }
-            
+        
         except Exception as e:
             self.logger.error(f"❌ Failed to get repository info for {repository}: {e}")
             raise
     
+    def _load_etag_cache(self):
+        """Restore conditional request entries saved by a previous run."""
+        try:
+            with open(self._etag_file, 'rb') as f:
+                entries = json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Could not read ETag cache: {e}")
+            return
+        
+        for path, params, etag, data, links in entries:
+            key = (path, tuple(tuple(param) for param in params))
+            links = {rel: {'url': URL(url)} for rel, url in links.items()}
+            self._etag_cache.set(key, (etag, data, links))
+        self.logger.info(f"📂 Loaded {len(entries)} cached GitHub responses")
+    
+    def _save_etag_cache(self):
+        """Write the conditional request entries to disk for the next run."""
+        entries = [
+            [path, params, etag, data, {rel: str(link['url']) for rel, link in links.items()}]
+            for (path, params), (etag, data, links) in self._etag_cache.items()
+        ]
+        try:
+            tmp_path = f"{self._etag_file}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(entries))
+            os.replace(tmp_path, self._etag_file)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not save ETag cache: {e}")
+    
     async def close(self):
         """Close the GitHub client and cleanup resources."""
+        if self._etag_file and len(self._etag_cache):
+            await asyncio.to_thread(self._save_etag_cache)
         if self.session:
             await self.session.close()
         self.logger.info("👋 GitHub client closed")
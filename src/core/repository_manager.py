@@ -8,12 +8,111 @@ and multi-repository operations.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import json
 from pathlib import Path
 
+from ..utils.cache import TTLCache
+from ..utils.helpers import json_dumps, json_loads
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+# Seconds to wait after a configuration change before writing the file, so a
+# burst of changes is saved once
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# Seconds a user's discovered repository list is reused before asking GitHub again
+DISCOVERY_CACHE_TTL = 300
+
+
+# Language -> framework -> words in a repository's topics or description that suggest it
+_FRAMEWORK_INDICATORS = {
+    'python': {
+        'django': ('django', 'web', 'webapp'),
+        'flask': ('flask', 'microservice', 'api'),
+        'fastapi': ('fastapi', 'api', 'async'),
+        'streamlit': ('streamlit', 'dashboard', 'visualization'),
+        'langchain': ('langchain', 'llm', 'ai', 'chatbot'),
+        'tensorflow': ('tensorflow', 'ml', 'machine-learning'),
+        'pytorch': ('pytorch', 'deep-learning', 'neural')
+    },
+    'javascript': {
+        'react': ('react', 'reactjs'),
+        'vue': ('vue', 'vuejs'),
+        'angular': ('angular', 'angularjs'),
+        'node': ('node', 'nodejs'),
+        'express': ('express', 'expressjs'),
+        'next': ('next', 'nextjs')
+    },
+    'java': {
+        'spring': ('spring',),
+        'springboot': ('springboot', 'spring-boot'),
+        'hibernate': ('hibernate',),
+        'maven': ('maven',),
+        'gradle': ('gradle',)
+    }
+}
+
+# Analysis tools and project checks enabled by default per language
+_LANGUAGE_TOOLS = {
+    'python': ('pylint', 'bandit', 'safety', 'mypy'),
+    'javascript': ('eslint', 'npm-audit', 'jshint'),
+    'java': ('spotbugs', 'pmd', 'checkstyle'),
+    'go': ('go-vet', 'golint', 'gosec')
+}
+
+_LANGUAGE_CHECKS = {
+    'python': ('check_requirements', 'check_setup_py'),
+    'javascript': ('check_package_json', 'check_node_modules'),
+    'java': ('check_maven', 'check_gradle'),
+    'go': ('check_go_mod', 'check_go_sum')
+}
+
+# Words in a lowercased description; hyphenated words such as machine-learning are
+# matched whole as well as by their parts (django-based, spring-boot)
+_DESCRIPTION_WORD = re.compile(r'[a-z0-9+#]+(?:-[a-z0-9+#]+)*')
+
+
+def _build_indicator_index() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Map each indicator word to the (language, framework) pairs it suggests."""
+    index: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+    for language, frameworks in _FRAMEWORK_INDICATORS.items():
+        for framework, words in frameworks.items():
+            for word in words:
+                index[word] = index.get(word, ()) + ((language, framework),)
+    return index
+
+
+_INDICATOR_INDEX = _build_indicator_index()
+
+
+def _detect_frameworks(language: str, topics: Iterable[str], description: str) -> List[str]:
+    """Detect the language's frameworks whose indicator words appear in the topics or description."""
+    words = set(topics)
+    words.update(
+        part
+        for word in _DESCRIPTION_WORD.findall(description)
+        for part in (word, *word.split('-'))
+    )
+    
+    matched = {
+        framework
+        for word in words
+        for indicated_language, framework in _INDICATOR_INDEX.get(word, ())
+        if indicated_language == language
+    }
+    # Report in the declared framework order
+    return [framework for framework in _FRAMEWORK_INDICATORS[language] if framework in matched]
+
 
 @dataclass
 class RepositoryConfig:
@@ -36,11 +135,26 @@ class RepositoryManager:
     """Manages dynamic repository discovery and configuration."""
     
     def __init__(self, github_client, config):
-        """Initialize repository manager."""
+        """Initialize repository manager.
+        
+        github_client is expected to be the application's shared, initialized
+        GitHubClient, so discovery and refresh fan-outs reuse its pooled connections.
+        """
         self.github_client = github_client
         self.config = config
         self.logger = logging.getLogger(__name__)
         
+        self._focus_areas = tuple(self.config.FOCUS_AREAS.split(','))
+        self._supported_languages = frozenset(
+            lang.strip().lower()
+            for lang in self.config.SUPPORTED_LANGUAGES.split(',')
+        )
+        self._supports_all_languages = 'all' in self._supported_languages
+        
+        # Repositories with the same language, topics and description share a
+        # default analysis config; build each combination once
+        self._default_analysis_config = lru_cache(maxsize=4096)(self._build_default_analysis_config)
+        
         # Repository storage
         self.repositories: Dict[str, RepositoryConfig] = {}
         self.config_file = Path("./cache/repositories.json")
@@ -48,38 +162,75 @@ class RepositoryManager:
         # Ensure cache directory exists
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Load existing configuration
-        self._load_repository_config()
+        # Lookup indexes over self.repositories, kept current by _index_repository.
+        # Dicts with None values serve as insertion-ordered sets of full names
+        self._by_language: Dict[str, Dict[str, None]] = {}
+        self._indexed_language: Dict[str, Optional[str]] = {}
+        self._enabled: Dict[str, None] = {}
+        
+        # Repository count per language as reported by get_repository_summary
+        self._language_counts: Counter = Counter()
+        
+        # Bumped whenever a repository is added or updated, so callers can tell
+        # when views built from the repositories are stale
+        self.version = 0
+        
+        # Pending configuration changes not yet written to config_file
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._save_lock: Optional[asyncio.Lock] = None
+        
+        # Recent discovery results per username
+        self._discovery_cache = TTLCache(
+            maxsize=64 if config.ENABLE_CACHING else 0,
+            ttl=DISCOVERY_CACHE_TTL
+        )
+        
+        # Bounds concurrent clones; created on first use so it belongs to the running loop
+        self._clone_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Local checkout of each repository cloned by clone_repository
+        self._local_paths: Dict[str, str] = {}
+        
+        # Existing configuration is loaded on first use, see _ensure_loaded
+        self._load_task: Optional[asyncio.Future] = None
+    
+    async def _ensure_loaded(self):
+        """Load the saved repository configuration the first time it is needed."""
+        if self._load_task is None:
+            # Read off the event loop; concurrent first callers share the one load
+            self._load_task = asyncio.ensure_future(asyncio.to_thread(self._load_repository_config))
+        await self._load_task
     
     async def discover_user_repositories(self, username: str) -> List[Dict[str, Any]]:
         """Discover all repositories for a GitHub user."""
+        await self._ensure_loaded()
+        
+        cached = self._discovery_cache.get(username)
+        if cached is not None:
+            return [dict(repo) for repo in cached]
+        
         try:
             self.logger.info(f"🔍 Discovering repositories for user: {username}")
             
-            # Get repositories from GitHub
-            repositories = await self.github_client.get_user_repositories(username)
-            
             # Filter by supported languages
             filtered_repos = []
-            supported_languages = set(
-                lang.strip().lower() 
-                for lang in self.config.SUPPORTED_LANGUAGES.split(',')
-            )
             
-            for repo in repositories:
+            async for repo in self.github_client.get_user_repositories(username):
                 repo_language = (repo.get('language') or '').lower()
                 
                 # Include if language is supported or if no language filter
-                if (not supported_languages or 
-                    repo_language in supported_languages or
-                    'all' in supported_languages):
-                    
+                if self._supports_all_languages or repo_language in self._supported_languages:
                     filtered_repos.append(repo)
-                    
-                    # Auto-configure repository
-                    await self._auto_configure_repository(repo)
+            
+            # Auto-configure the matching repositories together rather than one at a time
+            await asyncio.gather(
+                *(self._auto_configure_repository(repo) for repo in filtered_repos),
+                return_exceptions=True
+            )
             
             self.logger.info(f"✅ Discovered {len(filtered_repos)} repositories")
+            self._discovery_cache.set(username, [dict(repo) for repo in filtered_repos])
             return filtered_repos
             
         except Exception as e:
@@ -90,7 +241,7 @@ class RepositoryManager:
         """Automatically configure a discovered repository."""
         try:
             repo_config = RepositoryConfig(
-                owner=repo_data['full_name'].split('/')[0],
+                owner=(repo_data.get('owner') or {}).get('login') or repo_data['full_name'].split('/', 1)[0],
                 name=repo_data['name'],
                 full_name=repo_data['full_name'],
                 language=repo_data.get('language', 'unknown'),
@@ -100,6 +251,7 @@ class RepositoryManager:
             )
             
             self.repositories[repo_config.full_name] = repo_config
+            self._index_repository(repo_config)
             self.logger.debug(f"📝 Auto-configured repository: {repo_config.full_name}")
             
         except Exception as e:
@@ -109,113 +261,56 @@ class RepositoryManager:
         """Get default analysis configuration based on repository characteristics."""
         language = (repo_data.get('language') or '').lower()
         
+        # Topics and description only matter when frameworks are detected
+        if language in _FRAMEWORK_INDICATORS:
+            key = (language, frozenset(repo_data.get('topics') or ()), (repo_data.get('description') or '').lower())
+        else:
+            key = (language, frozenset(), '')
+        
+        # The cached config is shared, so hand out copies of its lists
+        return {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in self._default_analysis_config(*key).items()
+        }
+    
+    def _build_default_analysis_config(self, language: str, topics: FrozenSet[str],
+                                       description: str) -> Dict[str, Any]:
+        """Build the default analysis config for one language, topics and description combination."""
         config = {
             'security_scan': self.config.ENABLE_SECURITY_SCAN,
             'performance_scan': self.config.ENABLE_PERFORMANCE_SCAN,
             'dependency_scan': self.config.ENABLE_DEPENDENCY_SCAN,
             'code_quality_scan': True,
-            'focus_areas': self.config.FOCUS_AREAS.split(','),
+            'focus_areas': self._focus_areas,
             'auto_suggest_fixes': self.config.AUTO_SUGGEST_FIXES
         }
         
         # Language-specific configurations
-        if language == 'python':
-            config.update({
-                'tools': ['pylint', 'bandit', 'safety', 'mypy'],
-                'frameworks': self._detect_python_frameworks(repo_data),
-                'check_requirements': True,
-                'check_setup_py': True
-            })
-        elif language == 'javascript':
-            config.update({
-                'tools': ['eslint', 'npm-audit', 'jshint'],
-                'frameworks': self._detect_js_frameworks(repo_data),
-                'check_package_json': True,
-                'check_node_modules': True
-            })
-        elif language == 'java':
-            config.update({
-                'tools': ['spotbugs', 'pmd', 'checkstyle'],
-                'frameworks': self._detect_java_frameworks(repo_data),
-                'check_maven': True,
-                'check_gradle': True
-            })
-        elif language == 'go':
-            config.update({
-                'tools': ['go-vet', 'golint', 'gosec'],
-                'check_go_mod': True,
-                'check_go_sum': True
-            })
+        if language in _LANGUAGE_TOOLS:
+            config['tools'] = _LANGUAGE_TOOLS[language]
+        if language in _FRAMEWORK_INDICATORS:
+            config['frameworks'] = tuple(_detect_frameworks(language, topics, description))
+        config.update(dict.fromkeys(_LANGUAGE_CHECKS.get(language, ()), True))
         
         return config
     
-    def _detect_python_frameworks(self, repo_data: Dict[str, Any]) -> List[str]:
-        """Detect Python frameworks based on repository characteristics."""
-        frameworks = []
-        
-        # Check topics and description for framework indicators
-        topics = repo_data.get('topics', [])
-        description = (repo_data.get('description') or '').lower()
-        
-        framework_indicators = {
-            'django': ['django', 'web', 'webapp'],
-            'flask': ['flask', 'microservice', 'api'],
-            'fastapi': ['fastapi', 'api', 'async'],
-            'streamlit': ['streamlit', 'dashboard', 'visualization'],
-            'langchain': ['langchain', 'llm', 'ai', 'chatbot'],
-            'tensorflow': ['tensorflow', 'ml', 'machine-learning'],
-            'pytorch': ['pytorch', 'deep-learning', 'neural']
-        }
-        
-        for framework, indicators in framework_indicators.items():
-            if (framework in description or 
-                any(indicator in description for indicator in indicators) or
-                any(indicator in topics for indicator in indicators)):
-                frameworks.append(framework)
-        
-        return frameworks
-    
-    def _detect_js_frameworks(self, repo_data: Dict[str, Any]) -> List[str]:
-        """Detect JavaScript frameworks."""
-        frameworks = []
-        topics = repo_data.get('topics', [])
-        description = (repo_data.get('description') or '').lower()
-        
-        js_frameworks = ['react', 'vue', 'angular', 'node', 'express', 'next']
-        
-        for framework in js_frameworks:
-            if framework in description or framework in topics:
-                frameworks.append(framework)
-        
-        return frameworks
-    
-    def _detect_java_frameworks(self, repo_data: Dict[str, Any]) -> List[str]:
-        """Detect Java frameworks."""
-        frameworks = []
-        topics = repo_data.get('topics', [])
-        description = (repo_data.get('description') or '').lower()
-        
-        java_frameworks = ['spring', 'springboot', 'hibernate', 'maven', 'gradle']
-        
-        for framework in java_frameworks:
-            if framework in description or framework in topics:
-                frameworks.append(framework)
-        
-        return frameworks
-    
     async def get_repository_config(self, full_name: str) -> Optional[RepositoryConfig]:
         """Get configuration for a specific repository."""
+        await self._ensure_loaded()
         return self.repositories.get(full_name)
     
     async def configure_repository(self, full_name: str, config: Dict[str, Any]) -> bool:
         """Configure a specific repository."""
         try:
+            await self._ensure_loaded()
+            
             if full_name in self.repositories:
                 repo_config = self.repositories[full_name]
                 repo_config.analysis_config.update(config)
                 repo_config.enabled = config.get('enabled', repo_config.enabled)
+                self._index_repository(repo_config)
                 
-                self._save_repository_config()
+                self._schedule_save()
                 self.logger.info(f"✅ Updated configuration for {full_name}")
                 return True
             else:
@@ -228,30 +323,62 @@ class RepositoryManager:
     
     async def get_enabled_repositories(self) -> List[RepositoryConfig]:
         """Get all enabled repositories."""
-        return [repo for repo in self.repositories.values() if repo.enabled]
+        await self._ensure_loaded()
+        return [self.repositories[full_name] for full_name in self._enabled]
     
     async def get_repositories_by_language(self, language: str) -> List[RepositoryConfig]:
         """Get repositories filtered by programming language."""
+        await self._ensure_loaded()
         return [
-            repo for repo in self.repositories.values() 
-            if repo.language.lower() == language.lower() and repo.enabled
+            self.repositories[full_name]
+            for full_name in self._by_language.get(language.lower(), ())
+            if full_name in self._enabled
         ]
     
+    def _index_repository(self, repo_config: RepositoryConfig):
+        """Bring the language and enabled indexes up to date for one repository."""
+        self.version += 1
+        full_name = repo_config.full_name
+        
+        language = repo_config.language
+        if full_name not in self._indexed_language:
+            self._add_language_entry(full_name, language)
+        elif self._indexed_language[full_name] != language:
+            self._remove_language_entry(full_name, self._indexed_language[full_name])
+            self._add_language_entry(full_name, language)
+        
+        if repo_config.enabled:
+            self._enabled.setdefault(full_name, None)
+        else:
+            self._enabled.pop(full_name, None)
+    
+    def _add_language_entry(self, full_name: str, language: Optional[str]):
+        """Record a repository under its language in the language index and counts."""
+        self._by_language.setdefault((language or '').lower(), {})[full_name] = None
+        self._language_counts[language or 'unknown'] += 1
+        self._indexed_language[full_name] = language
+    
+    def _remove_language_entry(self, full_name: str, language: Optional[str]):
+        """Drop a repository from its previous language's index bucket and count."""
+        self._by_language[(language or '').lower()].pop(full_name, None)
+        
+        count_key = language or 'unknown'
+        self._language_counts[count_key] -= 1
+        if self._language_counts[count_key] <= 0:
+            del self._language_counts[count_key]
+    
     async def get_repository_summary(self) -> Dict[str, Any]:
         """Get summary of all configured repositories."""
-        total_repos = len(self.repositories)
-        enabled_repos = len([r for r in self.repositories.values() if r.enabled])
+        await self._ensure_loaded()
         
-        languages = {}
-        for repo in self.repositories.values():
-            lang = repo.language or 'unknown'
-            languages[lang] = languages.get(lang, 0) + 1
+        total_repos = len(self.repositories)
+        enabled_repos = len(self._enabled)
         
         return {
             'total_repositories': total_repos,
             'enabled_repositories': enabled_repos,
             'disabled_repositories': total_repos - enabled_repos,
-            'languages': languages,
+            'languages': dict(self._language_counts),
             'last_discovery': datetime.now().isoformat()
         }
     
@@ -259,10 +386,10 @@ class RepositoryManager:
         """Load repository configuration from file."""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
+                data = json_loads(self.config_file.read_bytes())
                 
                 for repo_data in data:
+                    last_analyzed = repo_data.get('last_analyzed')
                     repo_config = RepositoryConfig(
                         owner=repo_data['owner'],
                         name=repo_data['name'],
@@ -271,52 +398,98 @@ class RepositoryManager:
                         default_branch=repo_data['default_branch'],
                         enabled=repo_data.get('enabled', True),
                         analysis_config=repo_data.get('analysis_config', {}),
-                        last_analyzed=datetime.fromisoformat(repo_data['last_analyzed']) if repo_data.get('last_analyzed') else None
+                        last_analyzed=datetime.fromisoformat(last_analyzed) if last_analyzed else None
                     )
                     self.repositories[repo_config.full_name] = repo_config
+                    self._index_repository(repo_config)
                 
                 self.logger.info(f"📂 Loaded {len(self.repositories)} repository configurations")
                 
         except Exception as e:
             self.logger.warning(f"⚠️ Failed to load repository config: {e}")
     
-    def _save_repository_config(self):
+    async def _save_repository_config(self):
         """Save repository configuration to file."""
         try:
             data = []
             for repo in self.repositories.values():
-                data.append({
-                    'owner': repo.owner,
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'language': repo.language,
-                    'default_branch': repo.default_branch,
-                    'enabled': repo.enabled,
-                    'analysis_config': repo.analysis_config,
-                    'last_analyzed': repo.last_analyzed.isoformat() if repo.last_analyzed else None
-                })
+                # The instance dict already holds every field in declaration order;
+                # copy it rather than rebuilding the dict key by key
+                repo_data = vars(repo).copy()
+                last_analyzed = repo_data['last_analyzed']
+                repo_data['last_analyzed'] = last_analyzed.isoformat() if last_analyzed else None
+                data.append(repo_data)
             
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Serialized here, while the repositories cannot change underneath;
+            # only the file write runs in a thread
+            await asyncio.to_thread(self._write_config_file, json_dumps(data, indent=True))
                 
             self.logger.debug("💾 Saved repository configuration")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to save repository config: {e}")
     
+    def _write_config_file(self, payload: bytes):
+        """Replace the configuration file with payload."""
+        # Write beside the file and swap it in, so a crash never leaves it half written
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.config_file)
+    
+    def _schedule_save(self):
+        """Mark the configuration as changed and write it after a short delay."""
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self):
+        """Write pending configuration changes once the debounce delay has passed."""
+        await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+        # From here on flush() must not cancel this task mid-write
+        self._flush_task = None
+        await self._write_pending()
+    
+    async def _write_pending(self):
+        """Write the configuration file if it has unsaved changes."""
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        
+        # A write already in progress finishes before the next one starts
+        async with self._save_lock:
+            if self._dirty:
+                self._dirty = False
+                await self._save_repository_config()
+    
+    async def flush(self):
+        """Write pending configuration changes immediately."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+        await self._write_pending()
+    
+    async def cleanup(self):
+        """Release resources, saving any pending configuration changes."""
+        await self.flush()
+    
     async def refresh_repository_data(self, full_name: str) -> bool:
         """Refresh repository data from GitHub."""
         try:
+            await self._ensure_loaded()
+            
             owner, name = full_name.split('/')
             repo_data = await self.github_client.get_repository(owner, name)
             
+            # Later discoveries should see the refreshed data
+            self._discovery_cache.clear()
+            
             if full_name in self.repositories:
                 repo_config = self.repositories[full_name]
                 # Update with fresh data from GitHub
                 repo_config.language = repo_data.get('language', repo_config.language)
                 repo_config.default_branch = repo_data.get('default_branch', repo_config.default_branch)
+                self._index_repository(repo_config)
                 
-                self._save_repository_config()
+                self._schedule_save()
                 self.logger.info(f"🔄 Refreshed data for {full_name}")
                 return True
             
@@ -325,6 +498,15 @@ class RepositoryManager:
         except Exception as e:
             self.logger.error(f"❌ Failed to refresh repository data for {full_name}: {e}")
             return False
+    
+    async def refresh_many(self, full_names: List[str]) -> Dict[str, bool]:
+        """Refresh repository data from GitHub for several repositories at once."""
+        # The GitHub client bounds how many requests are in flight, and the
+        # debounced save writes the file once for the whole batch
+        results = await asyncio.gather(
+            *(self.refresh_repository_data(full_name) for full_name in full_names)
+        )
+        return dict(zip(full_names, results))
 
     async def clone_repository(self, repository: str, branch: str = None) -> str:
         """
@@ -339,7 +521,6 @@ class RepositoryManager:
         """
         import os
         import tempfile
-        import subprocess
         from pathlib import Path
         
         try:
@@ -361,28 +542,90 @@ class RepositoryManager:
             # Clone the repository
             self.logger.info(f"📥 Cloning {repository} (branch: {target_branch}) to {clone_dir}")
             
-            # Use git command to clone
-            cmd = [
-                'git', 'clone', 
-                '--depth', '1',  # Shallow clone for faster operation
-                '--branch', target_branch,
-                clone_url,
-                str(clone_dir)
-            ]
+            if self._clone_semaphore is None:
+                self._clone_semaphore = asyncio.Semaphore(max(1, self.config.CLONE_CONCURRENCY))
             
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=300  # 5 minute timeout
-            )
-            
-            if result.returncode != 0:
-                raise Exception(f"Git clone failed: {result.stderr}")
+            async with self._clone_semaphore:
+                if pygit2 is not None:
+                    # libgit2 clones in-process; run it off the event loop
+                    await asyncio.to_thread(
+                        pygit2.clone_repository,
+                        clone_url,
+                        str(clone_dir),
+                        depth=1,
+                        checkout_branch=target_branch
+                    )
+                else:
+                    # Use git command to clone
+                    cmd = [
+                        'git', 'clone', 
+                        '--depth', '1',  # Shallow clone for faster operation
+                        '--branch', target_branch,
+                        clone_url,
+                        str(clone_dir)
+                    ]
+                    
+                    # Runs as an asyncio subprocess so other requests proceed during the clone
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    try:
+                        _, stderr = await asyncio.wait_for(
+                            process.communicate(),
+                            timeout=300  # 5 minute timeout
+                        )
+                    except asyncio.TimeoutError:
+                        process.kill()
+                        await process.wait()
+                        raise Exception("Git clone timed out")
+                    
+                    if process.returncode != 0:
+                        raise Exception(f"Git clone failed: {stderr.decode(errors='replace')}")
             
             self.logger.info(f"✅ Successfully cloned {repository} to {clone_dir}")
+            self._local_paths[repository] = str(clone_dir)
             return str(clone_dir)
             
         except Exception as e:
             self.logger.error(f"❌ Failed to clone repository {repository}: {e}")
             raise Exception(f"Repository clone failed: {e}")
+    
+    async def get_local_path(self, repository: str) -> Optional[str]:
+        """Get the local checkout of a previously cloned repository, if it still exists."""
+        local_path = self._local_paths.get(repository)
+        # Checked in a worker thread so a slow filesystem doesn't stall the event loop
+        if local_path and await asyncio.to_thread(os.path.isdir, local_path):
+            return local_path
+        self._local_paths.pop(repository, None)
+        return None
+    
+    async def get_head_sha(self, repository: str, local_path: Optional[str] = None) -> Optional[str]:
+        """Get the commit checked out in the repository's local clone.
+        
+        Pass the path already returned by get_local_path or clone_repository to skip
+        looking the clone up again.
+        """
+        if local_path is None:
+            local_path = await self.get_local_path(repository)
+        if not local_path:
+            return None
+        
+        try:
+            if pygit2 is not None:
+                return await asyncio.to_thread(lambda: str(pygit2.Repository(local_path).head.target))
+            
+            process = await asyncio.create_subprocess_exec(
+                'git', '-C', local_path, 'rev-parse', 'HEAD',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await process.communicate()
+            if process.returncode != 0:
+                return None
+            return stdout.decode().strip()
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not read HEAD of {repository}: {e}")
+            return None
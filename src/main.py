@@ -7,7 +7,7 @@ with dynamic repository discovery and multi-language support.
 
 import asyncio
 import logging
-from typing import Any, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,12 +17,65 @@ from mcp import Resource, Tool
 from mcp.types import TextContent, ImageContent, EmbeddedResource
 
 from utils import Config, setup_logging
+from utils.cache import TTLCache
+from utils.helpers import json_dumps
 from core.github_client import GitHubClient
 from core.repository_manager import RepositoryManager
-from core.analyzer import CodeAnalyzer
+from core.analyzer import CodeAnalyzer, RepositoryAnalysis
 from tools import GitHubCodeReviewTools
 
 
+# URI prefix of the repository resources listed by the server
+_REPO_URI_PREFIX = "github://repository/"
+
+# Prompts offered by the server; they don't change, so list_prompts returns these
+_STATIC_PROMPTS = (
+    {
+        "name": "code_review",
+        "description": "Generate a comprehensive code review for a repository",
+        "arguments": [
+            {
+                "name": "repository",
+                "description": "Repository name (owner/repo format)",
+                "required": True
+            },
+            {
+                "name": "focus_areas",
+                "description": "Comma-separated focus areas (security,quality,performance)",
+                "required": False
+            }
+        ]
+    },
+    {
+        "name": "security_analysis",
+        "description": "Generate a security analysis report for a repository", 
+        "arguments": [
+            {
+                "name": "repository", 
+                "description": "Repository name (owner/repo format)",
+                "required": True
+            }
+        ]
+    },
+    {
+        "name": "improvement_suggestions",
+        "description": "Generate improvement suggestions for a repository",
+        "arguments": [
+            {
+                "name": "repository",
+                "description": "Repository name (owner/repo format)", 
+                "required": True
+            },
+            {
+                "name": "focus_area",
+                "description": "Specific area to focus on (security,performance,maintainability)",
+                "required": False
+            }
+        ]
+    }
+)
+
+
 class DynamicGitHubCodeReviewServer:
     """Dynamic GitHub Code Review MCP Server."""
     
@@ -44,6 +97,22 @@ class DynamicGitHubCodeReviewServer:
         self.analyzer = None
         self.tools = None
         
+        # Setup runs alongside the server; set once the components exist, or setup has failed
+        self._ready = asyncio.Event()
+        
+        # Analyses keyed by (repository, head commit), so prompts for the same snapshot
+        # reuse one run; the per-repository lock makes concurrent requests wait for it
+        self._analysis_cache = TTLCache(
+            maxsize=self.config.ANALYSIS_CACHE_SIZE if self.config.ENABLE_CACHING else 0,
+            ttl=self.config.CACHE_DURATION
+        )
+        self._analysis_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Resource list from the last list_resources call and the repository
+        # manager version it was built from
+        self._resources_cache: Optional[List[Resource]] = None
+        self._resources_version: Optional[int] = None
+        
         # Setup MCP handlers
         self._setup_mcp_handlers()
         
@@ -55,6 +124,11 @@ class DynamicGitHubCodeReviewServer:
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available tools."""
+            try:
+                await self._wait_until_ready()
+            except RuntimeError as e:
+                self.logger.warning(f"Listing tools before setup finished: {e}")
+            
             if self.tools:
                 return self.tools.tools
             return []
@@ -62,6 +136,11 @@ class DynamicGitHubCodeReviewServer:
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent | EmbeddedResource]:
             """Handle tool calls."""
+            try:
+                await self._wait_until_ready()
+            except RuntimeError as e:
+                return [TextContent(type="text", text=f"Tools not initialized: {e}")]
+            
             if self.tools:
                 return await self.tools.call_tool(name, arguments)
             return [TextContent(type="text", text="Tools not initialized")]
@@ -71,15 +150,21 @@ class DynamicGitHubCodeReviewServer:
             """List available resources."""
             resources = []
             
-            # Dynamic repository resources
+            # Dynamic repository resources, rebuilt only after the repositories change
             if self.repo_manager:
-                repos = await self.repo_manager.get_configured_repositories()
-                for repo_name, repo_config in repos.items():
-                    resources.append(Resource(
-                        uri=f"github://repository/{repo_name}",
-                        name=f"Repository: {repo_name}",
-                        description=f"{repo_config.get('language', 'Unknown')} repository"
-                    ))
+                version = self.repo_manager.version
+                if self._resources_cache is None or version != self._resources_version:
+                    repos = await self.repo_manager.get_configured_repositories()
+                    self._resources_cache = [
+                        Resource(
+                            uri=f"{_REPO_URI_PREFIX}{repo_name}",
+                            name=f"Repository: {repo_name}",
+                            description=f"{repo_config.get('language', 'Unknown')} repository"
+                        )
+                        for repo_name, repo_config in repos.items()
+                    ]
+                    self._resources_version = version
+                resources = list(self._resources_cache)
             
             return resources
         
@@ -87,15 +172,17 @@ class DynamicGitHubCodeReviewServer:
         async def handle_read_resource(uri: str) -> str:
             """Read resource content."""
             try:
-                if uri.startswith("github://repository/"):
-                    repo_name = uri.replace("github://repository/", "")
+                if uri.startswith(_REPO_URI_PREFIX):
+                    repo_name = uri[len(_REPO_URI_PREFIX):]
+                    await self._wait_until_ready()
                     
                     if self.repo_manager:
                         local_path = await self.repo_manager.get_local_path(repo_name)
                         if local_path:
-                            # Return repository analysis summary
-                            analysis = self.analyzer.analyze_repository(local_path, repo_name)
-                            return f"Repository Analysis for {repo_name}:\n{analysis.to_dict()}"
+                            # Return repository analysis summary, shared with the prompts
+                            analysis = await self._ensure_analysis(repo_name)
+                            payload = json_dumps(analysis.to_dict()).decode('utf-8')
+                            return f"Repository Analysis for {repo_name}:\n{payload}"
                     
                     return f"Repository {repo_name} not found or not cloned"
                 
@@ -107,51 +194,7 @@ class DynamicGitHubCodeReviewServer:
         @self.server.list_prompts()
         async def handle_list_prompts():
             """List available prompts."""
-            return [
-                {
-                    "name": "code_review",
-                    "description": "Generate a comprehensive code review for a repository",
-                    "arguments": [
-                        {
-                            "name": "repository",
-                            "description": "Repository name (owner/repo format)",
-                            "required": True
-                        },
-                        {
-                            "name": "focus_areas",
-                            "description": "Comma-separated focus areas (security,quality,performance)",
-                            "required": False
-                        }
-                    ]
-                },
-                {
-                    "name": "security_analysis",
-                    "description": "Generate a security analysis report for a repository", 
-                    "arguments": [
-                        {
-                            "name": "repository", 
-                            "description": "Repository name (owner/repo format)",
-                            "required": True
-                        }
-                    ]
-                },
-                {
-                    "name": "improvement_suggestions",
-                    "description": "Generate improvement suggestions for a repository",
-                    "arguments": [
-                        {
-                            "name": "repository",
-                            "description": "Repository name (owner/repo format)", 
-                            "required": True
-                        },
-                        {
-                            "name": "focus_area",
-                            "description": "Specific area to focus on (security,performance,maintainability)",
-                            "required": False
-                        }
-                    ]
-                }
-            ]
+            return list(_STATIC_PROMPTS)
         
         @self.server.get_prompt()
         async def handle_get_prompt(name: str, arguments: dict):
@@ -212,6 +255,9 @@ class DynamicGitHubCodeReviewServer:
                 self.analyzer
             )
             
+            # Components are usable now; requests needn't wait for discovery
+            self._ready.set()
+            
             # Discover repositories on startup
             await self._discover_initial_repositories()
             
@@ -220,48 +266,88 @@ class DynamicGitHubCodeReviewServer:
         except Exception as e:
             self.logger.error(f"Failed to setup server components: {e}")
             raise
+        
+        finally:
+            # Also on failure, so waiting requests get an error instead of a timeout
+            self._ready.set()
+    
+    async def _wait_until_ready(self):
+        """Wait for setup to finish before using the server components."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self.config.SETUP_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Server is still starting up, try again shortly")
+        
+        if self.repo_manager is None or self.analyzer is None:
+            raise RuntimeError("Server components failed to initialize")
     
     async def _discover_initial_repositories(self):
         """Discover initial repositories for the configured user."""
         try:
             self.logger.info(f"Discovering repositories for user: {self.config.GITHUB_USERNAME}")
             
-            repositories = await self.github_client.get_user_repositories(
-                self.config.GITHUB_USERNAME,
-                include_private=self.config.INCLUDE_PRIVATE_REPOS,
-                include_forks=self.config.INCLUDE_FORKS,
-                max_repos=self.config.MAX_REPOSITORIES
-            )
+            # Private/fork filters and the repository limit come from the client's config
+            repositories = [
+                repo async for repo in self.github_client.get_user_repositories(self.config.GITHUB_USERNAME)
+            ]
             
             await self.repo_manager.update_repositories(repositories)
             
             self.logger.info(f"Discovered {len(repositories)} repositories")
             
-            # Log repository details
-            for repo in repositories[:5]:  # Log first 5 repos
-                self.logger.info(
+            # Log details of the first 5 repos as one record
+            if repositories and self.logger.isEnabledFor(logging.INFO):
+                lines = [
                     f"Repository: {repo['full_name']} "
                     f"({repo.get('language', 'Unknown')}) - "
                     f"{repo.get('stargazers_count', 0)} stars"
-                )
-            
-            if len(repositories) > 5:
-                self.logger.info(f"... and {len(repositories) - 5} more repositories")
+                    for repo in repositories[:5]
+                ]
+                if len(repositories) > 5:
+                    lines.append(f"... and {len(repositories) - 5} more repositories")
+                self.logger.info("\n".join(lines))
         
         except Exception as e:
             self.logger.error(f"Failed to discover initial repositories: {e}")
     
-    async def _generate_code_review_prompt(self, repository: str, focus_areas: list) -> str:
-        """Generate a code review prompt."""
-        try:
-            # Ensure repository is analyzed
+    async def _ensure_analysis(self, repository: str) -> RepositoryAnalysis:
+        """Get an analysis of the repository, cloning and analyzing it if needed."""
+        await self._wait_until_ready()
+        
+        lock = self._analysis_locks.setdefault(repository, asyncio.Lock())
+        async with lock:
             local_path = await self.repo_manager.get_local_path(repository)
             if not local_path:
                 local_path = await self.repo_manager.clone_repository(repository)
             
-            analysis = self.analyzer.analyze_repository(local_path, repository)
+            key = (repository, await self.repo_manager.get_head_sha(repository, local_path))
+            analysis = self._analysis_cache.get(key)
+            if analysis is None:
+                # Analysis is CPU-bound; run it in a thread so other handlers keep
+                # being served (the analyzer spreads files over its own worker pool)
+                analysis = await asyncio.to_thread(self.analyzer.analyze_repository, local_path, repository)
+                self._analysis_cache.set(key, analysis)
+        
+        return analysis
+    
+    @staticmethod
+    def _index_issues(analysis: RepositoryAnalysis, categories: set, limit: int = 10) -> Dict[str, List[str]]:
+        """Bucket the first high/medium severity issues of each category in one pass."""
+        buckets: Dict[str, List[str]] = {category: [] for category in categories}
+        for file_result in analysis.file_results:
+            for issue in file_result.issues:
+                bucket = buckets.get(issue.get('category'))
+                if bucket is not None and len(bucket) < limit and issue.get('severity') in ('high', 'medium'):
+                    bucket.append(f"- **{file_result.file_path}**: {issue.get('description', 'Unknown issue')}")
+        return buckets
+    
+    async def _generate_code_review_prompt(self, repository: str, focus_areas: list) -> str:
+        """Generate a code review prompt."""
+        try:
+            # Ensure repository is analyzed
+            analysis = await self._ensure_analysis(repository)
             
-            prompt = f"""# Code Review for {repository}
+            parts = [f"""# Code Review for {repository}
 
 ## Repository Overview
 - **Languages**: {', '.join(analysis.languages.keys())}
@@ -275,28 +361,26 @@ class DynamicGitHubCodeReviewServer:
 {analysis.summary}
 
 ## Key Issues Found
-"""
+"""]
             
             # Add top issues by focus areas
+            issues_by_category = self._index_issues(
+                analysis, {focus_area.strip() for focus_area in focus_areas}
+            )
             for focus_area in focus_areas:
-                focus_issues = []
-                for file_result in analysis.file_results:
-                    for issue in file_result.issues:
-                        if issue.get('category') == focus_area.strip() and issue.get('severity') in ['high', 'medium']:
-                            focus_issues.append(f"- **{file_result.file_path}**: {issue.get('description', 'Unknown issue')}")
-                
+                focus_issues = issues_by_category.get(focus_area.strip())
                 if focus_issues:
-                    prompt += f"\n### {focus_area.title()} Issues\n"
-                    prompt += '\n'.join(focus_issues[:10])  # Top 10 issues
-                    prompt += "\n"
+                    parts.append(f"\n### {focus_area.title()} Issues\n")
+                    parts.append('\n'.join(focus_issues))  # Top 10 issues
+                    parts.append("\n")
             
-            prompt += f"""
+            parts.append(f"""
 ## Recommendations
 Based on this analysis, please provide a comprehensive code review focusing on the {', '.join(focus_areas)} areas. 
 Include specific recommendations for improvement and highlight any critical issues that need immediate attention.
-"""
+""")
             
-            return prompt
+            return ''.join(parts)
         
         except Exception as e:
             return f"Error generating code review prompt: {str(e)}"
@@ -304,36 +388,31 @@ Include specific recommendations for improvement and highlight any critical issu
     async def _generate_security_analysis_prompt(self, repository: str) -> str:
         """Generate a security analysis prompt."""
         try:
-            local_path = await self.repo_manager.get_local_path(repository)
-            if not local_path:
-                local_path = await self.repo_manager.clone_repository(repository)
+            analysis = await self._ensure_analysis(repository)
             
-            analysis = self.analyzer.analyze_repository(local_path, repository)
-            
-            # Extract security issues
-            security_issues = []
+            # Count security issues, keeping the first 10 high severity ones
+            security_count = 0
+            high_priority = []
             for file_result in analysis.file_results:
                 for issue in file_result.issues:
                     if issue.get('category') == 'security':
-                        security_issues.append({
-                            'file': file_result.file_path,
-                            'issue': issue
-                        })
+                        security_count += 1
+                        if len(high_priority) < 10 and issue.get('severity') == 'high':
+                            high_priority.append((file_result.file_path, issue))
             
-            prompt = f"""# Security Analysis for {repository}
+            parts = [f"""# Security Analysis for {repository}
 
 ## Security Score: {analysis.overall_scores.get('security', 0):.1f}/100
 
-## Security Issues Found: {len(security_issues)}
+## Security Issues Found: {security_count}
 
 ### High Priority Security Issues
-"""
+"""]
             
-            high_priority = [issue for issue in security_issues if issue['issue'].get('severity') == 'high']
-            for issue_data in high_priority[:10]:
-                prompt += f"- **{issue_data['file']}** (Line {issue_data['issue'].get('line', 'Unknown')}): {issue_data['issue'].get('description', 'Unknown issue')}\n"
+            for file_path, issue in high_priority:
+                parts.append(f"- **{file_path}** (Line {issue.get('line', 'Unknown')}): {issue.get('description', 'Unknown issue')}\n")
             
-            prompt += f"""
+            parts.append(f"""
 ### Dependencies
 {analysis.dependencies}
 
@@ -343,9 +422,9 @@ Please provide a comprehensive security assessment of this repository. Focus on:
 2. Security best practices that should be implemented
 3. Dependency security recommendations
 4. Overall security posture and improvements needed
-"""
+""")
             
-            return prompt
+            return ''.join(parts)
         
         except Exception as e:
             return f"Error generating security analysis prompt: {str(e)}"
@@ -353,23 +432,28 @@ Please provide a comprehensive security assessment of this repository. Focus on:
     async def _generate_improvement_suggestions_prompt(self, repository: str, focus_area: str = None) -> str:
         """Generate improvement suggestions prompt."""
         try:
-            local_path = await self.repo_manager.get_local_path(repository)
-            if not local_path:
-                local_path = await self.repo_manager.clone_repository(repository)
-            
-            analysis = self.analyzer.analyze_repository(local_path, repository)
+            analysis = await self._ensure_analysis(repository)
             
-            # Collect suggestions
-            all_suggestions = []
+            # Group the first 5 suggestions of each priority in one pass
+            high_priority = []
+            medium_priority = []
+            files_with_issues = 0
             for file_result in analysis.file_results:
+                if file_result.issues:
+                    files_with_issues += 1
+                if len(high_priority) == 5 and len(medium_priority) == 5:
+                    # Both lists are full; only the issue count still needs the remaining files
+                    continue
                 for suggestion in file_result.suggestions:
-                    if not focus_area or suggestion.get('type') == focus_area:
-                        all_suggestions.append({
-                            'file': file_result.file_path,
-                            'suggestion': suggestion
-                        })
-            
-            prompt = f"""# Improvement Suggestions for {repository}
+                    if focus_area and suggestion.get('type') != focus_area:
+                        continue
+                    priority = suggestion.get('priority')
+                    if priority == 'high' and len(high_priority) < 5:
+                        high_priority.append((file_result.file_path, suggestion))
+                    elif priority == 'medium' and len(medium_priority) < 5:
+                        medium_priority.append((file_result.file_path, suggestion))
+            
+            parts = [f"""# Improvement Suggestions for {repository}
 
 ## Current Scores
 - Security: {analysis.overall_scores.get('security', 0):.1f}/100
@@ -381,33 +465,29 @@ Please provide a comprehensive security assessment of this repository. Focus on:
 ## Key Metrics
 - Languages: {', '.join(analysis.languages.keys())}
 - Total Files: {analysis.total_files}
-- Files with Issues: {len([f for f in analysis.file_results if f.issues])}
+- Files with Issues: {files_with_issues}
 
 ## Improvement Opportunities
-"""
-            
-            # Group suggestions by priority
-            high_priority = [s for s in all_suggestions if s['suggestion'].get('priority') == 'high']
-            medium_priority = [s for s in all_suggestions if s['suggestion'].get('priority') == 'medium']
+"""]
             
             if high_priority:
-                prompt += "### High Priority\n"
-                for item in high_priority[:5]:
-                    prompt += f"- **{item['file']}**: {item['suggestion'].get('description', 'Unknown suggestion')}\n"
+                parts.append("### High Priority\n")
+                for file_path, suggestion in high_priority:
+                    parts.append(f"- **{file_path}**: {suggestion.get('description', 'Unknown suggestion')}\n")
             
             if medium_priority:
-                prompt += "\n### Medium Priority\n"
-                for item in medium_priority[:5]:
-                    prompt += f"- **{item['file']}**: {item['suggestion'].get('description', 'Unknown suggestion')}\n"
+                parts.append("\n### Medium Priority\n")
+                for file_path, suggestion in medium_priority:
+                    parts.append(f"- **{file_path}**: {suggestion.get('description', 'Unknown suggestion')}\n")
             
-            prompt += f"""
+            parts.append(f"""
 ## Request
 Based on this analysis, please provide actionable improvement recommendations for this repository. 
 Focus on {focus_area if focus_area else 'overall code quality, security, and performance'}. 
 Prioritize suggestions that will have the most impact on code quality and maintainability.
-"""
+""")
             
-            return prompt
+            return ''.join(parts)
         
         except Exception as e:
             return f"Error generating improvement suggestions prompt: {str(e)}"
@@ -421,6 +501,9 @@ Prioritize suggestions that will have the most impact on code quality and mainta
             if self.repo_manager:
                 await self.repo_manager.cleanup()
             
+            if self.analyzer:
+                self.analyzer.cleanup()
+            
             self.logger.info("Server cleanup complete")
         
         except Exception as e:
@@ -432,10 +515,9 @@ async def main():
     server_instance = DynamicGitHubCodeReviewServer()
     
     try:
-        await server_instance.setup()
-        
-        # Run the server
-        await server_instance.server.run()
+        # Run the server while its components are set up, so clients get answers
+        # right away; requests that need the components wait for setup to finish
+        await asyncio.gather(server_instance.setup(), server_instance.server.run())
     
     except KeyboardInterrupt:
         server_instance.logger.info("Server interrupted by user")
@@ -5,7 +5,13 @@ Provides common utilities for configuration, logging, and helper functions.
 """
 
 from .config import Config
-from .logger import setup_logging, get_logger, CodeReviewLogger
+from .logger import (
+    setup_logging,
+    get_logger,
+    get_worker_log_queue,
+    setup_worker_logging,
+    CodeReviewLogger
+)
 from .helpers import (
     sanitize_filename,
     format_file_size,
@@ -20,6 +26,8 @@ __all__ = [
     'Config',
     'setup_logging',
     'get_logger', 
+    'get_worker_log_queue',
+    'setup_worker_logging',
     'CodeReviewLogger',
     'sanitize_filename',
     'format_file_size',
@@ -0,0 +1,64 @@
+"""
+In-memory caching utilities for the GitHub Code Review MCP Server.
+
+Provides a small size-bounded cache whose entries expire after a time to live.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """LRU cache whose entries expire a fixed number of seconds after they are stored."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        """Initialize an empty cache holding at most maxsize entries."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self.timer():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entries when full."""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+
+        self._entries[key] = (self.timer() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether key has a live entry."""
+        return self.get(key, _MISSING) is not _MISSING
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Live (key, value) pairs, least recently used first."""
+        now = self.timer()
+        return [(key, value) for key, (expires_at, value) in self._entries.items() if expires_at > now]
+
+    def __len__(self) -> int:
+        """Number of stored entries, including any not yet evicted after expiring."""
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+
+_MISSING = object()
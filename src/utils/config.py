@@ -4,12 +4,29 @@ Configuration management for the GitHub Code Review MCP Server.
 Loads configuration from environment variables with sensible defaults.
 """
 
+import fnmatch
 import os
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Pattern, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
 
+@lru_cache(maxsize=8)
+def _compile_exclude_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern]:
+    """Combine exclude globs into one regex matching any of them."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(pattern.strip()) for pattern in patterns))
+
+
+@lru_cache(maxsize=8)
+def _exclude_directory_set(directories: Tuple[str, ...]) -> FrozenSet[str]:
+    """Stripped exclude directory names as a set."""
+    return frozenset(directory.strip() for directory in directories)
+
+
 class Config:
     """Configuration class for the MCP server."""
     
@@ -39,6 +56,7 @@ class Config:
         self.MAX_REPOSITORIES = int(os.getenv('MAX_REPOSITORIES', '50'))
         self.INCLUDE_PRIVATE_REPOS = os.getenv('INCLUDE_PRIVATE_REPOS', 'false').lower() == 'true'
         self.INCLUDE_FORKS = os.getenv('INCLUDE_FORKS', 'false').lower() == 'true'
+        self.CLONE_CONCURRENCY = int(os.getenv('CLONE_CONCURRENCY', '4'))
         
         # Analysis Configuration
         self.MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', '1048576'))  # 1MB
@@ -46,6 +64,8 @@ class Config:
         self.ENABLE_SECURITY_SCAN = os.getenv('ENABLE_SECURITY_SCAN', 'true').lower() == 'true'
         self.ENABLE_PERFORMANCE_SCAN = os.getenv('ENABLE_PERFORMANCE_SCAN', 'true').lower() == 'true'
         self.ENABLE_DEPENDENCY_SCAN = os.getenv('ENABLE_DEPENDENCY_SCAN', 'true').lower() == 'true'
+        self.ANALYSIS_WORKERS = int(os.getenv('ANALYSIS_WORKERS', str(os.cpu_count() or 1)))
+        self.MAX_ANALYZE_FILES = int(os.getenv('MAX_ANALYZE_FILES', '100'))
         
         # Supported Languages
         self.SUPPORTED_LANGUAGES = os.getenv(
@@ -68,14 +88,17 @@ class Config:
         self.MCP_SERVER_VERSION = os.getenv('MCP_SERVER_VERSION', '1.0.0')
         self.SERVER_HOST = os.getenv('SERVER_HOST', 'localhost')
         self.SERVER_PORT = int(os.getenv('SERVER_PORT', '8000'))
+        self.SETUP_WAIT_TIMEOUT = int(os.getenv('SETUP_WAIT_TIMEOUT', '60'))
         
         # API Configuration
         self.GITHUB_API_RATE_LIMIT = int(os.getenv('GITHUB_API_RATE_LIMIT', '5000'))
         self.REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', '0.1'))
+        self.ASYNC_CONCURRENCY = int(os.getenv('ASYNC_CONCURRENCY', '10'))
         
         # Cache Configuration
         self.ENABLE_CACHING = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
         self.CACHE_DURATION = int(os.getenv('CACHE_DURATION', '3600'))  # 1 hour
+        self.ANALYSIS_CACHE_SIZE = int(os.getenv('ANALYSIS_CACHE_SIZE', '32'))
         self.CACHE_DIR = os.getenv('CACHE_DIR', './cache')
         
         # Analysis Exclusions
@@ -128,20 +151,14 @@ class Config:
     
     def is_file_excluded(self, file_path: str) -> bool:
         """Check if a file should be excluded from analysis."""
-        import fnmatch
-        
-        # Check exclude patterns
-        for pattern in self.EXCLUDE_PATTERNS:
-            if fnmatch.fnmatch(file_path, pattern.strip()):
-                return True
+        # Check exclude patterns, compiled once per pattern list
+        pattern = _compile_exclude_patterns(tuple(self.EXCLUDE_PATTERNS))
+        if pattern is not None and pattern.match(os.path.normcase(file_path)):
+            return True
         
         # Check exclude directories
-        path_parts = Path(file_path).parts
-        for exclude_dir in self.EXCLUDE_DIRECTORIES:
-            if exclude_dir.strip() in path_parts:
-                return True
-        
-        return False
+        exclude_dirs = _exclude_directory_set(tuple(self.EXCLUDE_DIRECTORIES))
+        return not exclude_dirs.isdisjoint(Path(file_path).parts)
     
     def __repr__(self):
         """String representation of configuration (excluding sensitive data)."""
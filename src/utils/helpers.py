@@ -6,14 +6,29 @@ Contains various utility functions for file handling, code analysis, and data pr
 
 import re
 import os
+import json
 import hashlib
 import mimetypes
+import mmap
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Any, List, Dict, Optional, Set, Tuple, Iterator, Union
 import ast
 import tokenize
 import io
 
+try:
+    # Optional: faster JSON decoding
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files smaller than this are read into memory rather than memory-mapped
+MMAP_THRESHOLD = 4096
+
+# Read size when hashing files
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename for safe file system usage."""
@@ -550,13 +565,70 @@ def calculate_file_hash(file_path: str) -> str:
     
     try:
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                 hash_sha256.update(chunk)
         return hash_sha256.hexdigest()
     except (OSError, IOError):
         return ""
 
 
+@contextmanager
+def map_file(file_path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Map a file read-only into memory; small files are returned as plain bytes."""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def iter_lines(buf: Union[bytes, mmap.mmap]) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, line) pairs from a buffer, dropping newlines and trailing CRs."""
+    start = 0
+    while start is not None:
+        end = buf.find(b'\n', start)
+        if end == -1:
+            line, next_start = buf[start:], None
+        else:
+            line, next_start = buf[start:end], end + 1
+        
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        yield start, line
+        start = next_start
+
+
+def count_occurrences(buf: Union[bytes, mmap.mmap], needle: bytes) -> int:
+    """Count non-overlapping occurrences of needle in a bytes or mmap buffer."""
+    count = 0
+    pos = buf.find(needle)
+    while pos != -1:
+        count += 1
+        pos = buf.find(needle, pos + len(needle))
+    return count
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when it is installed and can represent it."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # e.g. non-string dict keys, which the json module coerces
+            pass
+    return json.dumps(data, indent=2 if indent else None, separators=None if indent else (',', ':')).encode('utf-8')
+
+
 def detect_dependencies(file_path: str, language: str = None) -> Dict[str, List[str]]:
     """Detect dependencies and package requirements from source files."""
     dependencies = {'direct': [], 'dev': [], 'optional': []}
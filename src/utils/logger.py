@@ -4,11 +4,15 @@ Logging configuration and utilities for the GitHub Code Review MCP Server.
 Provides structured logging with configurable output formats and destinations.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import json
 from datetime import datetime
 
@@ -39,6 +43,17 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_obj)
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a listener thread in the same process."""
+    
+    def prepare(self, record):
+        """Merge the message arguments but keep exception info for the real handlers to format."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class CodeReviewLogger:
     """Logger configuration for the GitHub Code Review MCP Server."""
     
@@ -46,6 +61,13 @@ class CodeReviewLogger:
         """Initialize logging configuration."""
         self.config = config
         self.logger = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._queue_handler: Optional[logging.Handler] = None
+        
+        # Queues worker processes log to, by start method, and the listeners forwarding them
+        self._worker_queues: Dict[str, Any] = {}
+        self._worker_listeners: List[logging.handlers.QueueListener] = []
+        self._worker_lock = threading.Lock()
         self._setup_logging()
     
     def _setup_logging(self):
@@ -56,6 +78,7 @@ class CodeReviewLogger:
         
         # Clear existing handlers
         self.logger.handlers.clear()
+        handlers = []
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
@@ -72,16 +95,27 @@ class CodeReviewLogger:
             )
         
         console_handler.setFormatter(console_format)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler (if enabled)
         if self.config.ENABLE_FILE_LOGGING:
-            self._setup_file_logging()
+            handlers.append(self._setup_file_logging())
+        
+        # Formatting and writing happen on a listener thread, so logging from async
+        # handlers never blocks the event loop on stream or file I/O
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = _InProcessQueueHandler(log_queue)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.stop)
         
         # Suppress verbose third-party loggers
         self._suppress_third_party_logs()
     
-    def _setup_file_logging(self):
+    def _setup_file_logging(self) -> logging.Handler:
         """Setup file logging with rotation."""
         log_file = Path(self.config.LOG_FILE)
         log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -96,7 +130,7 @@ class CodeReviewLogger:
         
         # Use JSON format for file logs for better parsing
         file_handler.setFormatter(JSONFormatter())
-        self.logger.addHandler(file_handler)
+        return file_handler
     
     def _suppress_third_party_logs(self):
         """Suppress verbose third-party library logs."""
@@ -110,6 +144,33 @@ class CodeReviewLogger:
         if self.config.LOG_LEVEL != 'DEBUG':
             logging.getLogger('asyncio').setLevel(logging.ERROR)
     
+    def worker_queue(self, context):
+        """Get a queue that processes started with the given multiprocessing context can log to."""
+        with self._worker_lock:
+            method = context.get_start_method()
+            log_queue = self._worker_queues.get(method)
+            if log_queue is None:
+                # Records from the workers join this process's own queue, so they
+                # reach the same console and file handlers
+                log_queue = context.Queue()
+                listener = logging.handlers.QueueListener(log_queue, self._queue_handler)
+                listener.start()
+                self._worker_queues[method] = log_queue
+                self._worker_listeners.append(listener)
+            return log_queue
+    
+    def stop(self):
+        """Write out queued records and stop the listener threads."""
+        with self._worker_lock:
+            for listener in self._worker_listeners:
+                listener.stop()
+            self._worker_listeners.clear()
+            self._worker_queues.clear()
+        
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """Get a logger instance."""
         if name:
@@ -251,6 +312,8 @@ _logger_instance: Optional[CodeReviewLogger] = None
 def setup_logging(config) -> CodeReviewLogger:
     """Setup global logging configuration."""
     global _logger_instance
+    if _logger_instance is not None:
+        _logger_instance.stop()
     _logger_instance = CodeReviewLogger(config)
     return _logger_instance
 
@@ -262,6 +325,21 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return _logger_instance.get_logger(name)
 
 
+def get_worker_log_queue(context):
+    """Get a queue for worker processes started with the given context to log to."""
+    if _logger_instance is None:
+        raise RuntimeError("Logging not initialized. Call setup_logging() first.")
+    return _logger_instance.worker_queue(context)
+
+
+def setup_worker_logging(log_queue, log_level: str):
+    """Send a worker process's logs to the parent process through its log queue."""
+    logger = logging.getLogger('github_code_review')
+    logger.setLevel(getattr(logging, log_level))
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 def log_analysis_start(repository: str, analysis_type: str):
     """Log the start of a code analysis."""
     if _logger_instance: